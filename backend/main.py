@@ -6,23 +6,40 @@
 
 # asyncio - helps handle multiple tasks at the same time (asynchronous programming)
 import asyncio
-# json - converts Python objects to/from JSON format for web communication
-import json
+# hashlib - fast hashing, used to build cache keys from transcript text
+import hashlib
+# itertools - efficient looping tools (we use count() as a lightweight counter)
+import itertools
 # logging - provides professional logging capabilities instead of print statements
 import logging
 # os - lets us access environment variables and system settings
 import os
+# re - regular expressions for matching text patterns
+import re
+# struct - packs numbers into fixed-size binary layouts (our WebSocket frame headers)
+import struct
+# time - clock functions (monotonic time for the health check)
+import time
+# collections - extra container types (OrderedDict keeps entries in insertion order,
+# deque is a list with fast adding/removing at both ends)
+from collections import OrderedDict, deque
+# concurrent.futures - thread pools for the few blocking calls we can't avoid
+# (wait() lets a worker thread wait for a call running in another thread)
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for_threads
 # typing - helps with type hints to make code clearer and catch bugs
-from typing import Dict, Any, List
+from typing import AsyncIterator, Deque, Dict, Any, Iterator, List, Optional, Tuple, Union, TypedDict
 
+# orjson - fast JSON library (written in Rust) that serializes straight to bytes
+# Used for WebSocket control messages and API responses, and to parse Gemini's replies
+import orjson
 # websockets - enables real-time communication between frontend and backend
 import websockets
 # FastAPI - modern web framework for building APIs quickly
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+# ORJSONResponse - sends JSON responses serialized with orjson
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 # CORS middleware - allows our React frontend to communicate with this backend
 from fastapi.middleware.cors import CORSMiddleware
-# pydantic - validates data structures and converts them automatically
-from pydantic import BaseModel
 
 # Deepgram - AI service for speech-to-text transcription
 from deepgram import DeepgramClient, PrerecordedOptions, LiveTranscriptionEvents, LiveOptions, ClientOptionsFromEnv
@@ -31,11 +48,9 @@ from dotenv import load_dotenv
 # Google Generative AI - Google's AI service for generating summaries
 import google.generativeai as genai
 
-# SSL and certificate handling - ensures secure connections
-import ssl
+# certifi - bundle of trusted SSL certificates, ensures secure connections
 import certifi
 # Threading tools for handling multiple tasks
-import queue
 import threading
 
 # 🔐 ENHANCED SSL CERTIFICATE SETUP FOR MACOS
@@ -46,7 +61,15 @@ def setup_ssl():
     
     SSL certificates are like digital ID cards that prove websites are legitimate.
     macOS sometimes has issues finding the right certificates, so we set them explicitly.
+    
+    The libraries we use (Deepgram, Gemini) build their own SSL connections from these
+    environment variables, so we only set the variables - no SSL context is created here.
+    If SSL_CERT_FILE is already set (by you, or because this is a uvicorn worker / reload
+    process that inherited it from the process that already ran this), nothing is done.
     """
+    if os.environ.get('SSL_CERT_FILE'):
+        return
+    
     # certifi.where() returns the path to trusted certificate bundle
     cert_file = certifi.where()
     
@@ -54,19 +77,21 @@ def setup_ssl():
     os.environ['SSL_CERT_FILE'] = cert_file        # For general SSL connections
     os.environ['REQUESTS_CA_BUNDLE'] = cert_file   # For requests library
     os.environ['CURL_CA_BUNDLE'] = cert_file       # For curl commands
-    
-    # Create SSL context for better compatibility
-    # This is like setting up a secure communication channel
-    ssl_context = ssl.create_default_context(cafile=cert_file)
-    return ssl_context
 
 # Call the SSL setup function immediately when the server starts
 setup_ssl()
 
+# 🌍 LOAD ENVIRONMENT VARIABLES
+# Environment variables store secret keys and configuration
+# They're kept in a .env file that's not shared publicly
+# (loaded before logging is set up, so LOG_LEVEL in .env is respected)
+load_dotenv()
+
 # 📝 CONFIGURE LOGGING SYSTEM
 # Set up professional logging with proper formatting and levels
 logging.basicConfig(
-    level=logging.DEBUG,  # Set to DEBUG for more detailed logs, INFO for normal operation
+    # Set LOG_LEVEL=INFO for normal operation (skips debug-only work like per-chunk logs)
+    level=os.getenv("LOG_LEVEL", "DEBUG").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),  # Output to console
@@ -78,16 +103,12 @@ logging.basicConfig(
 # Create a logger specifically for our AI processing
 logger = logging.getLogger('AINoteTaker')
 
-# 🌍 LOAD ENVIRONMENT VARIABLES
-# Environment variables store secret keys and configuration
-# They're kept in a .env file that's not shared publicly
-load_dotenv()
-
 # 🚀 CREATE FASTAPI APPLICATION
 # FastAPI is our web server framework - it handles HTTP requests and responses
 app = FastAPI(
     title="AI Note Taker API",                    # Name shown in API documentation
-    description="Real-time transcription with AI-powered summaries"  # Description for docs
+    description="Real-time transcription with AI-powered summaries",  # Description for docs
+    default_response_class=ORJSONResponse,        # Endpoints that return data are serialized with orjson
 )
 
 # 🔗 ADD CORS MIDDLEWARE
@@ -111,17 +132,275 @@ if GEMINI_API_KEY:
     # Create a model instance - 'gemini-1.5-flash' is fast and good for text processing
     model = genai.GenerativeModel('gemini-1.5-flash')
 
-# 📋 PYDANTIC MODELS FOR API REQUESTS
+# Older google-generativeai releases only have the blocking generate_content();
+# check once at startup which call generate_summary() should use
+GEMINI_HAS_ASYNC = hasattr(genai.GenerativeModel, "generate_content_async")
+
+# 🎤 CONFIGURE DEEPGRAM CLIENT
+# One Deepgram client is shared by every WebSocket connection.
+# Creating the client sets up HTTP sessions and SSL state, so we only do it once at startup
+# and each connection just opens its own live transcription stream from it.
+DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")  # Get API key from environment variables
+deepgram_client = DeepgramClient(DEEPGRAM_API_KEY) if DEEPGRAM_API_KEY else None
+
+# 🚀 ENHANCED DEEPGRAM OPTIONS - Using supported features only
+# LiveOptions configures how Deepgram processes our audio.
+# The options are the same for every connection, so they are built once here
+# and every live stream is started with this same object.
+LIVE_OPTIONS = LiveOptions(
+    # 🎯 CORE MODEL CONFIGURATION
+    model="nova-3",        # Deepgram's newest and most accurate model
+    language="en-US",      # English (United States)
+
+    # 🎤 DIARIZATION - Speaker identification 
+    # This will tell us when different speakers are talking
+    # Very useful for meetings with multiple people
+    diarize=True,
+
+    # ✏️ PUNCTUATION - Add punctuation and capitalization
+    # Makes text properly formatted with periods, commas, capital letters, etc.
+    # Without this, text would be all lowercase with no punctuation
+    punctuate=True,
+
+    # 🤖 SMART FORMAT - Enhanced formatting
+    # Formats dates, times, numbers, currencies properly
+    # Example: "twenty five dollars" → "$25"
+    # Example: "january first twenty twenty four" → "January 1st, 2024"
+    smart_format=True,
+
+    # 📊 ADDITIONAL QUALITY IMPROVEMENTS
+    interim_results=True,      # Show partial results as user speaks (live feedback)
+    utterance_end_ms=1000,     # End utterance after 1 second of silence
+    vad_events=True,           # Voice activity detection (knows when someone starts/stops talking)
+    profanity_filter=False,    # Keep original speech (don't censor bad words)
+)
+
+# 📋 API REQUEST SHAPES
 # These define the structure of data our API expects to receive
-class SummaryRequest(BaseModel):
+class SummaryRequest(TypedDict, total=False):
     """
     Data structure for summary requests from the frontend
     
-    BaseModel automatically validates that incoming data matches this structure
-    If someone sends invalid data, Pydantic will reject it automatically
+    This is a plain dictionary shape (no Pydantic model): the /api/summarize endpoint
+    parses the request body itself with orjson and checks these two fields directly,
+    which skips building and re-validating a model on every request.
     """
     text: str                           # The transcribed text to summarize (required)
-    summary_type: str = "meeting"       # Type of summary (optional, defaults to "meeting")
+    summary_type: str                   # Type of summary (optional, defaults to "meeting")
+
+# 📦 BINARY WEBSOCKET FRAME FORMAT
+# Every message to the frontend is a binary frame made of one or more records.
+# Each record is a small fixed-size header followed by UTF-8 text:
+#
+#   uint8 record type | uint8 is_final | uint8 speaker | uint32 seq | uint32 length | text
+#   (little-endian, 11 bytes of header)
+#
+# - Record type 0 (RECORD_JSON): the text is a JSON message (ready, errors, connection status...)
+# - Record type 1 (RECORD_TRANSCRIPTION): the text is the transcribed sentence. is_final and the
+#   speaker ID (NO_SPEAKER when there is none) are in the header, so the hot path - one record per
+#   transcription result - needs no JSON at all, on the server or in the browser.
+#   seq numbers the transcription records sent on a connection (0, 1, 2, ...) in order.
+FRAME_RECORD_HEADER = struct.Struct("<BBBII")
+RECORD_JSON = 0
+RECORD_TRANSCRIPTION = 1
+NO_SPEAKER = 255
+
+def json_record(payload: bytes) -> bytes:
+    """Wrap an already-encoded JSON message as a RECORD_JSON record"""
+    return FRAME_RECORD_HEADER.pack(RECORD_JSON, 0, NO_SPEAKER, 0, len(payload)) + payload
+
+# 📨 PRE-ENCODED WEBSOCKET FRAMES
+# These control messages never change, so we serialize them once when the server starts
+# instead of building and encoding the same dictionary for every connection.
+# Each one is a complete RECORD_JSON record, ready to send on its own or inside a bigger frame.
+READY_MSG = json_record(orjson.dumps({"type": "ready", "message": "Ready to receive audio"}))
+CONN_OPENED_MSG = json_record(orjson.dumps({"type": "connection_opened", "message": "Connected to Deepgram"}))
+CONN_CLOSED_MSG = json_record(orjson.dumps({"type": "connection_closed", "message": "Disconnected from Deepgram"}))
+CONNECT_FAILED_MSG = json_record(orjson.dumps({"type": "error", "message": "Failed to connect to Deepgram"}))
+
+# 📦 MESSAGE BATCHING
+# Maximum number of queued messages combined into one WebSocket frame
+MAX_BATCH_MESSAGES = 128
+# Number of waiting messages at which a client counts as too slow. From then on new
+# interim results are dropped (a newer one will replace them anyway). Final results,
+# status and error messages are never dropped: they push out the oldest waiting interim
+# result, or go past this limit when none is left - the frontend builds the transcript
+# from final results alone, so losing one would leave a hole in it for good.
+MESSAGE_QUEUE_MAXSIZE = 256
+# Dropped interim results are logged at most once per this many seconds per connection
+# (a stalled client drops one for every Deepgram result)
+DROPPED_INTERIM_LOG_INTERVAL = 5.0
+
+# Put into the message queue by close() to tell process_messages() to stop
+# (after sending everything that was queued before it)
+STOP_PROCESSING = object()
+# 🏁 ENDING A RECORDING
+# When recording stops, the browser sends this text frame and keeps the socket open until
+# the server closes it - so the transcripts of the last words can still reach it
+STOP_COMMAND = "stop"
+# How long (seconds) we wait for the last audio to be sent and Deepgram to finish the stream...
+STOP_FLUSH_TIMEOUT = 5.0
+# ...and how long process_messages() then gets to send the last messages before it is
+# cancelled - a dead socket must not hold up the cleanup
+MESSAGE_DRAIN_TIMEOUT = 2.0
+
+def is_interim(message: Union[Dict[str, Any], bytes]) -> bool:
+    """True for interim (not final) transcription messages - the only ones safe to drop"""
+    return isinstance(message, dict) and message.get("type") == "transcription" and not message.get("is_final")
+
+def encode_frame(messages: List[Union[Dict[str, Any], bytes]], seq: Iterator[int]) -> bytes:
+    """
+    Encode queued messages as one binary WebSocket frame (see BINARY WEBSOCKET FRAME FORMAT)
+    
+    - Transcription messages become RECORD_TRANSCRIPTION records numbered from seq
+    - Pre-encoded records (bytes, like CONN_OPENED_MSG) are copied in as they are
+    - Any other message is encoded with orjson as a RECORD_JSON record
+    """
+    records = []
+    for message in messages:
+        if isinstance(message, bytes):
+            records.append(message)
+        elif message.get("type") == "transcription":
+            text = message["text"].encode()
+            speaker = message.get("speaker")
+            if speaker is None or not 0 <= speaker < NO_SPEAKER:
+                speaker = NO_SPEAKER
+            records.append(FRAME_RECORD_HEADER.pack(
+                RECORD_TRANSCRIPTION, 1 if message.get("is_final") else 0, speaker, next(seq), len(text)
+            ))
+            records.append(text)
+        else:
+            records.append(json_record(orjson.dumps(message)))
+    return b"".join(records)
+
+# 🎵 AUDIO FORWARDING SETTINGS
+# Maximum number of audio chunks waiting to be sent to Deepgram per connection
+# (the frontend sends a chunk every 100ms, so 64 chunks is about 6 seconds of audio).
+# When it is full we stop reading from the browser until there is room again - chunks are
+# never dropped, because they are slices of ONE WebM/Opus stream (the first one carries
+# the stream header) and Deepgram can't decode the stream if any piece is missing.
+AUDIO_QUEUE_MAXSIZE = 64
+# Chunks that are already waiting are combined into one Deepgram send of up to this many bytes
+AUDIO_BATCH_BYTES = 16384
+# How long (seconds) to hold audio back waiting for MORE chunks to combine. Off (0) by default:
+# our frontend sends one chunk every 100ms, so waiting would only add latency to every chunk.
+# Set AUDIO_BATCH_WINDOW_MS (e.g. 20) for clients that send many tiny chunks close together
+AUDIO_BATCH_WINDOW = float(os.getenv("AUDIO_BATCH_WINDOW_MS", "0")) / 1000
+
+# 🧵 WORKER THREADS FOR BLOCKING CALLS
+# The Deepgram live client's start()/send()/finish() and (on older SDKs) Gemini's
+# generate_content() block, so they run in worker threads instead of on the event loop.
+# Each kind of work gets its own pool, so slow calls can never use up the threads that
+# live sessions need for their audio:
+#   • DEEPGRAM_EXECUTOR         → send(): one short socket write per audio batch (the hot path)
+#   • DEEPGRAM_CONNECT_EXECUTOR → start() (DNS, TCP, TLS and WebSocket handshakes) and
+#                                 finish() (always sleeps 0.5s, then joins the SDK's threads)
+#   • GEMINI_EXECUTOR           → summaries on SDKs without an async API
+# A burst of clients connecting or hanging up only queues up behind each other in the
+# small connect pool - the audio of sessions already running keeps flowing.
+# Submitting to these pools directly also skips the context copy that asyncio.to_thread()
+# makes on every call.
+DEEPGRAM_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="deepgram-io")
+DEEPGRAM_CONNECT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="deepgram-connect")
+GEMINI_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gemini")
+
+# 📝 GEMINI PROMPT TEMPLATES
+# One template per summary type. They are built once when the server starts;
+# each request only fills in the transcribed text where {text} appears
+PROMPT_TEMPLATES: Dict[str, str] = {
+    # Focus on tasks and to-dos
+    "action_items": """
+    Analyze this transcription and extract action items, tasks, and to-dos:
+    
+    Text: {text}
+    
+    Please provide a JSON response with:
+    - action_items: List of specific tasks or actions mentioned
+    - Each action item should include task, responsible_party (if mentioned), and deadline (if mentioned)
+    """,
+    
+    # Focus on main takeaways
+    "key_points": """
+    Analyze this transcription and extract the key points and main takeaways:
+    
+    Text: {text}
+    
+    Please provide a JSON response with:
+    - key_points: List of the most important points discussed
+    - summary: Brief overall summary
+    """,
+    
+    # Focus on what each speaker contributed
+    "speaker_analysis": """
+    Analyze this transcription and provide per-speaker analysis:
+    
+    Text: {text}
+    
+    Please provide a JSON response with:
+    - speaker_summary: List of objects with speaker_id, main_points, and action_items for each speaker
+    - summary: Overall summary of the conversation
+    """,
+    
+    # Default comprehensive meeting summary
+    "meeting": """
+    Analyze this meeting transcription and provide a comprehensive summary:
+    
+    Text: {text}
+    
+    Please provide a JSON response with:
+    - summary: Brief overall summary (2-3 sentences)
+    - key_points: List of main discussion points
+    - action_items: List of tasks/actions with responsible_party and deadline if mentioned
+    - decisions: List of decisions made
+    - next_steps: List of next steps or follow-ups
+    
+    Make sure the response is valid JSON format.
+    """,
+}
+
+# Each template split into (text before {text}, text after {text}).
+# Building a prompt is then a plain concatenation - no .format() parsing of the long template
+PROMPT_PARTS: Dict[str, Tuple[str, str]] = {
+    name: tuple(template.split("{text}", 1)) for name, template in PROMPT_TEMPLATES.items()
+}
+
+# 🧹 MARKDOWN CODE FENCE PATTERN
+# Matches a Gemini reply wrapped in ```json ... ``` (or plain ``` ... ```) and captures the inside.
+# Compiled once so every reply is cleaned with a single regex match.
+JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+# 📐 EXPECTED SUMMARY SHAPE
+# Gemini's reply must be a JSON object, and these fields (when present) must be lists -
+# the frontend loops over them. Anything else is returned as a raw_response instead.
+SUMMARY_LIST_FIELDS = ("key_points", "action_items", "decisions", "next_steps", "speaker_summary")
+
+# ✂️ SHORT TEXT SHORTCUT
+# A few seconds of speech has nothing to summarize, and Gemini often answers such short
+# prompts with plain prose instead of JSON. Texts with fewer words than this get a
+# minimal summary built right here, without calling Gemini at all.
+SHORT_SUMMARY_MAX_WORDS = 20
+
+# 🗄️ SUMMARY CACHE
+# Clicking "summarize" again on the same transcript (or the same text and summary type)
+# returns the stored result instead of waiting seconds for another Gemini call.
+# Keys are (summary_type, 16-byte BLAKE2b hash of the text) so we don't keep big transcripts
+# around as keys; the least recently used entry is dropped once the cache is full.
+# Like SUMMARY_IN_FLIGHT below, the cache lives in memory and is per worker process: with
+# several workers (see WEB_CONCURRENCY) a repeated request may land on a worker that hasn't
+# seen it and calls Gemini again. Run a single worker to share one cache for everyone.
+SUMMARY_CACHE_MAX_ENTRIES = 256
+SUMMARY_CACHE: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+# Summaries that are being generated right now (same keys as SUMMARY_CACHE), each running
+# as its own task. A second identical request waits for that task instead of calling Gemini again.
+SUMMARY_IN_FLIGHT: "Dict[Tuple[str, bytes], asyncio.Task]" = {}
+
+def sse_event(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode one Server-Sent Event: a "data:" line followed by a blank line
+    
+    orjson never puts newlines in its output, so the JSON always fits on one data line.
+    """
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
 
 # 🎙️ TRANSCRIPTION MANAGER CLASS
 # This class handles all the real-time speech-to-text functionality
@@ -140,23 +419,32 @@ class TranscriptionManager:
         __init__ is a special method that runs when we create a new instance of this class
         It sets up all the initial values and connections we need
         """
-        # Get Deepgram API key from environment variables
-        self.api_key = os.getenv("DEEPGRAM_API_KEY")
-        if not self.api_key:
+        # The shared Deepgram client is only created when the API key is configured
+        if deepgram_client is None:
             # If no API key found, raise an error - we can't work without it
             raise ValueError("DEEPGRAM_API_KEY not found in environment variables")
         
-        # Create Deepgram client - this is our connection to Deepgram's AP service
-        self.deepgram = DeepgramClient(self.api_key)
-        print(f"🔗 [ASYNC] Deepgram client created: {self.deepgram}")
+        # Reuse the shared Deepgram client - only the live connection is per-session
+        self.deepgram = deepgram_client
+        print(f"🔗 [ASYNC] Using shared Deepgram client: {self.deepgram}")
         
         # Initialize instance variables (these belong to each specific instance)
         self.connection = None          # Will hold our live transcription connection
         self.websocket = None          # Will hold our WebSocket connection to frontend
-        self.full_transcript = ""      # Stores the complete transcript as it builds up
         self.is_connected = False      # Tracks whether we're connected to Deepgram
-        self.message_queue = queue.Queue()  # Queue for messages from callbacks
+        self.message_queue: Deque[Union[Dict[str, Any], bytes]] = deque()  # Messages waiting to go to the frontend
+        self.message_ready = None      # asyncio.Event set when message_queue has something (created on the event loop)
+        self.dropped_interim_count = 0 # Interim results dropped because the client couldn't keep up
+        self._last_drop_log = 0.0      # time.monotonic() of the last "dropped interim" log line
+        self.record_seq = itertools.count()  # Numbers the transcription records sent to the frontend
         self.loop = None               # Will store the event loop for async operations
+        self.audio_queue = None        # Bounded asyncio.Queue of audio chunks waiting to go to Deepgram
+        self.audio_sender_task = None  # Background task that drains audio_queue into Deepgram
+        self._send_future: Optional[Future] = None  # The latest connection.send() handed to a worker thread
+        # Per-message debug logs run for every transcription, on the event loop that serves every
+        # session - so we decide once (not per message) whether they are wanted at all
+        self.log_messages = __debug__ and logger.isEnabledFor(logging.DEBUG)
+        self._closed = False           # Set by close() so cleanup only ever runs once
     
     async def start_transcription(self, websocket: WebSocket):
         """
@@ -178,38 +466,13 @@ class TranscriptionManager:
             print(f"📡 [ASYNC] WebSocket stored: {id(websocket)}")
             
             # Store the current event loop for handling async operations
-            self.loop = asyncio.get_event_loop()
+            # (get_running_loop() is the direct way to get it from inside a coroutine)
+            self.loop = asyncio.get_running_loop()
             print(f"🔄 [ASYNC] Event loop captured: {id(self.loop)}")
             
-            # 🚀 ENHANCED DEEPGRAM OPTIONS - Using supported features only
-            # LiveOptions configures how Deepgram processes our audio
-            options = LiveOptions(
-                # 🎯 CORE MODEL CONFIGURATION
-                model="nova-3",        # Deepgram's newest and most accurate model
-                language="en-US",      # English (United States)
-                
-                # 🎤 DIARIZATION - Speaker identification 
-                # This will tell us when different speakers are talking
-                # Very useful for meetings with multiple people
-                diarize=True,
-                
-                # ✏️ PUNCTUATION - Add punctuation and capitalization
-                # Makes text properly formatted with periods, commas, capital letters, etc.
-                # Without this, text would be all lowercase with no punctuation
-                punctuate=True,
-                
-                # 🤖 SMART FORMAT - Enhanced formatting
-                # Formats dates, times, numbers, currencies properly
-                # Example: "twenty five dollars" → "$25"
-                # Example: "january first twenty twenty four" → "January 1st, 2024"
-                smart_format=True,
-                
-                # 📊 ADDITIONAL QUALITY IMPROVEMENTS
-                interim_results=True,      # Show partial results as user speaks (live feedback)
-                utterance_end_ms=1000,     # End utterance after 1 second of silence
-                vad_events=True,           # Voice activity detection (knows when someone starts/stops talking)
-                profanity_filter=False,    # Keep original speech (don't censor bad words)
-            )
+            # The Deepgram callbacks below hand their messages to this event loop, which adds
+            # them to message_queue and sets message_ready to wake up process_messages()
+            self.message_ready = asyncio.Event()
             
             # 🔗 CREATE LIVE TRANSCRIPTION CONNECTION
             # This creates a persistent connection to Deepgram's servers
@@ -227,13 +490,21 @@ class TranscriptionManager:
             self.connection.on(LiveTranscriptionEvents.Close, self.on_close)
             
             # 🚀 START THE CONNECTION
-            # FIXED: Don't await the start method - it returns a boolean, not a coroutine
+            # start() is a regular (blocking) method that returns a boolean, not a coroutine.
+            # It opens the WebSocket to Deepgram - DNS, TCP and TLS handshakes, often a few hundred ms -
+            # so it runs in a worker thread: other sessions on this server keep streaming meanwhile
             print("🔗 [ASYNC] Starting Deepgram connection...")
-            result = self.connection.start(options)
+            result = await self.loop.run_in_executor(DEEPGRAM_CONNECT_EXECUTOR, self.connection.start, LIVE_OPTIONS)
             
             if result:
                 # Connection started successfully
                 self.is_connected = True
+                
+                # 🎵 START THE AUDIO SENDER
+                # Audio chunks from the frontend go into a bounded queue and a dedicated task
+                # forwards them to Deepgram, so the WebSocket receive loop never waits on Deepgram
+                self.audio_queue = asyncio.Queue(maxsize=AUDIO_QUEUE_MAXSIZE)
+                self.audio_sender_task = asyncio.create_task(self._drain_audio())
                 print("✅ [ASYNC] Deepgram connection started successfully!")
                 return True
             else:
@@ -244,10 +515,10 @@ class TranscriptionManager:
         except Exception as e:
             # If anything goes wrong, log the error and notify the frontend
             print(f"Error starting transcription: {e}")
-            await websocket.send_text(json.dumps({
+            await websocket.send_bytes(json_record(orjson.dumps({
                 "type": "error",
                 "message": f"Failed to start transcription: {str(e)}"
-            }))
+            })))
             return False
     
     def on_open(self, *args, **kwargs):
@@ -260,94 +531,93 @@ class TranscriptionManager:
         print("🎤 [CALLBACK] Deepgram connection opened (running in callback thread)")
         print(f"🧵 [CALLBACK] Current thread: {threading.current_thread().name}")
         self.is_connected = True
-        # Queue a message to send to the frontend
-        self.queue_message({
-            "type": "connection_opened",
-            "message": "Connected to Deepgram"
-        })
+        # Queue the pre-encoded message to send to the frontend
+        self.queue_message(CONN_OPENED_MSG)
         print("📬 [CALLBACK] Connection opened message queued")
     
     def on_message(self, *args, **kwargs):
         """
         Handle enhanced transcription results from Deepgram
         
-        This is the most important function - it processes the speech-to-text results
-        and sends them back to the frontend with all the enhanced features
+        This runs on Deepgram's receive thread - the sooner it returns, the sooner the SDK
+        reads the next result from its socket. So it does no work of its own: the raw result
+        is handed to the event loop, and _ingest() reads it there.
+        """
+        # Extract the result from the callback arguments
+        result = kwargs.get('result')
+        if result is None:
+            return
+        
+        # 🔁 HAND OFF TO THE EVENT LOOP
+        # The SDK builds a new result object for every message, so it is safe to read later
+        try:
+            self.loop.call_soon_threadsafe(self._ingest, result)
+        except RuntimeError:
+            # The event loop has already shut down - nobody is left to receive the result
+            print("⚠️ [CALLBACK] Event loop is closed, dropping transcription")
+    
+    def _ingest(self, result):
+        """
+        Turn one Deepgram result into a message for the frontend (runs on the event loop thread)
+        
+        on_message() schedules this with call_soon_threadsafe, so the result is read and the
+        message queue is only ever touched from the event loop thread.
         """
         try:
-            # Extract the result from the callback arguments
-            result = kwargs.get('result')
-            
             # Check if we have a valid result with transcription data
-            if result and hasattr(result, 'channel'):
-                # Get the transcription alternatives (Deepgram usually provides the best one first)
-                alternatives = result.channel.alternatives
-                
-                if alternatives and len(alternatives) > 0:
-                    # Get the best transcription result
-                    transcript_data = alternatives[0]
-                    sentence = transcript_data.transcript  # The actual transcribed text
-                    
-                    # Only process if we have actual text (not empty)
-                    if len(sentence.strip()) > 0:
-                        # Check if this is final or interim (temporary) text
-                        is_final = result.is_final
-                        
-                        # 🔍 EXTRACT ENHANCED FEATURES
-                        # Get individual words with timing and speaker information
-                        words = getattr(transcript_data, 'words', [])
-                        
-                        # 👤 SPEAKER INFORMATION (if diarization is enabled)
-                        speaker_info = None
-                        if words and len(words) > 0:
-                            # Check if speaker information is available in the first word
-                            first_word = words[0]
-                            if hasattr(first_word, 'speaker'):
-                                speaker_info = first_word.speaker  # Speaker ID (0, 1, 2, etc.)
-                        
-                        # 📝 ADD TO FULL TRANSCRIPT (only for final results)
-                        if is_final:
-                            if speaker_info is not None:
-                                # Add speaker label to transcript
-                                self.full_transcript += f"\n[Speaker {speaker_info}]: {sentence}"
-                            else:
-                                # Add text without speaker label
-                                self.full_transcript += " " + sentence
-                        
-                        # 📤 CREATE ENHANCED MESSAGE FOR FRONTEND
-                        # This message contains all the information our React app needs
-                        message = {
-                            "type": "transcription",              # Message type
-                            "text": sentence,                     # The transcribed text
-                            "is_final": is_final,                 # Whether this is final or still changing
-                            "full_transcript": self.full_transcript.strip(),  # Complete transcript so far
-                            
-                            # 🆕 NEW: Enhanced features information
-                            "speaker": speaker_info,              # Which speaker is talking (0, 1, 2, etc.)
-                            "has_diarization": speaker_info is not None,  # Whether speaker detection worked
-                            "word_count": len(words),             # Number of words in this segment
-                            
-                            # Status of which features are currently active
-                            "features_used": {
-                                "diarization": True,              # Speaker ID is enabled
-                                "redaction": False,               # Not supported in this SDK version
-                                "paragraphs": False,              # Not supported in this SDK version
-                                "punctuation": True,              # Auto punctuation is enabled
-                                "smart_format": True              # Smart formatting is enabled
-                            }
-                        }
-                        
-                        # Add message to queue to be sent to frontend
-                        self.queue_message(message)
-                        print(f"📬 [CALLBACK] Transcription queued: '{sentence[:50]}...' (is_final: {is_final})")
-                        
-        except Exception as e:
-            # If anything goes wrong processing the transcription, log it
-            print(f"❌ [CALLBACK] Error processing transcription: {e}")
-            self.queue_message({
+            if not hasattr(result, 'channel'):
+                return
+            
+            # Get the transcription alternatives (Deepgram usually provides the best one first)
+            alternatives = result.channel.alternatives
+            if not alternatives:
+                return
+            
+            # Get the best transcription result
+            transcript_data = alternatives[0]
+            sentence = transcript_data.transcript  # The actual transcribed text
+            
+            # Only process if we have actual text (not empty)
+            if not sentence.strip():
+                return
+            
+            # Check if this is final or interim (temporary) text
+            is_final = result.is_final
+            
+            # 🔍 EXTRACT ENHANCED FEATURES
+            # Get individual words with timing and speaker information.
+            # The SDK's result classes always define `words` and each word's `speaker`
+            # (None when missing), so we read them directly - no getattr/hasattr checks
+            words = transcript_data.words or ()
+            
+            # 👤 SPEAKER INFORMATION (if diarization is enabled)
+            # Speaker ID (0, 1, 2, etc.) of the first word, or None
+            speaker_info = words[0].speaker if words else None
+            
+        except (AttributeError, IndexError, TypeError) as e:
+            # A result that doesn't have the shape we expect - log it and tell the frontend
+            print(f"❌ [INGEST] Error processing transcription: {e}")
+            self._enqueue({
                 "type": "error",
                 "message": f"Error processing transcription: {str(e)}"
             })
+            return
+        
+        # 📤 CREATE ENHANCED MESSAGE FOR FRONTEND
+        # Only these fields reach the browser - encode_frame() packs them into a binary record
+        message = {
+            "type": "transcription",              # Message type
+            "text": sentence,                     # The transcribed text
+            "is_final": is_final,                 # Whether this is final or still changing
+            "speaker": speaker_info,              # Which speaker is talking (0, 1, 2, etc.)
+        }
+        
+        # Add message to queue to be sent to frontend
+        # (the server keeps no transcript: the frontend appends each final result, with its
+        # speaker label, to its own copy - so no message ever repeats the whole meeting)
+        self._enqueue(message)
+        if __debug__ and self.log_messages:
+            logger.debug(f"📬 [INGEST] Transcription queued: '{sentence[:50]}...' (is_final: {is_final})")
     
     def on_error(self, error, **kwargs):
         """
@@ -365,53 +635,123 @@ class TranscriptionManager:
         """
         print("Deepgram connection closed")
         self.is_connected = False
-        self.queue_message({
-            "type": "connection_closed",
-            "message": "Disconnected from Deepgram"
-        })
+        self.queue_message(CONN_CLOSED_MSG)
     
-    def queue_message(self, message: Dict[str, Any]):
+    def queue_message(self, message: Union[Dict[str, Any], bytes]):
         """
         Add a message to the queue to be sent to the frontend
         
         We use a queue because the Deepgram callbacks run in different threads
-        than our main WebSocket connection, so we need a thread-safe way to pass messages
+        than our main WebSocket connection, so we need a thread-safe way to pass messages.
+        call_soon_threadsafe asks the event loop to add the message from its own thread
+        (see _enqueue) - which also wakes up process_messages() immediately instead of it
+        checking the queue on a timer.
+        
+        The message can be a dictionary (encoded when sent) or a pre-encoded record
+        (like CONN_OPENED_MSG) which is sent as-is.
         """
         try:
-            print(f"📥 [QUEUE] Adding message to queue (thread: {threading.current_thread().name})")
-            self.message_queue.put_nowait(message)  # Add message to queue without waiting
-            print(f"📊 [QUEUE] Queue size now: {self.message_queue.qsize()}")
-        except queue.Full:
-            print("⚠️ [QUEUE] Message queue is full, dropping message")
+            if __debug__ and self.log_messages:
+                logger.debug(f"📥 [QUEUE] Adding message to queue (thread: {threading.current_thread().name})")
+            self.loop.call_soon_threadsafe(self._enqueue, message)
+        except RuntimeError:
+            # The event loop has already shut down - nobody is left to receive the message
+            print("⚠️ [QUEUE] Event loop is closed, dropping message")
+    
+    def _enqueue(self, message: Union[Dict[str, Any], bytes]):
+        """
+        Add a message to message_queue and wake up process_messages() (runs on the event loop thread)
+        
+        message_queue is a plain deque: only the event loop thread touches it, so it needs
+        no locks, and setting the message_ready Event is all the signalling required.
+        
+        A new interim result replaces interim results still waiting at the end of the queue:
+        each one is just an older guess at the same words, so sending it would be wasted work.
+        
+        If the client is too slow and the queue has reached MESSAGE_QUEUE_MAXSIZE:
+        - a new interim result is dropped (the next interim result replaces it anyway)
+        - any other message (final result, status, error) makes room by removing the
+          oldest waiting interim result - or, if none is waiting, is added anyway.
+          Final text is never dropped: the frontend builds the transcript from it.
+        """
+        queue = self.message_queue
+        if is_interim(message):
+            # Drop older interim results that haven't been sent yet (never finals)
+            while queue and is_interim(queue[-1]):
+                queue.pop()
+        
+        if len(queue) >= MESSAGE_QUEUE_MAXSIZE:
+            if is_interim(message):
+                self._count_dropped_interim()
+                return
+            
+            # Remove the oldest waiting interim result to make room (if there is one)
+            for index, queued in enumerate(queue):
+                if is_interim(queued):
+                    del queue[index]
+                    self._count_dropped_interim()
+                    break
+        
+        queue.append(message)
+        self.message_ready.set()
+    
+    def _count_dropped_interim(self):
+        """Count a dropped interim result, logging the running total at most every few seconds"""
+        self.dropped_interim_count += 1
+        now = time.monotonic()
+        if now - self._last_drop_log >= DROPPED_INTERIM_LOG_INTERVAL:
+            self._last_drop_log = now
+            logger.warning(f"⚠️ [QUEUE] Client is slow, dropping interim results (total dropped: {self.dropped_interim_count})")
     
     async def process_messages(self):
         """
         Process messages from the queue and send them to the frontend
         
-        This runs continuously in the background, checking for new messages
+        This runs continuously in the background, waiting for new messages
         and sending them through the WebSocket connection
+        
+        Deepgram often produces several interim results in a burst. Everything waiting in
+        the queue (up to MAX_BATCH_MESSAGES) is sent together as ONE binary WebSocket frame
+        of back-to-back records (see encode_frame) - fewer frames, TLS records and TCP packets.
+        
+        This is the ONLY task that sends transcription messages for a connection:
+        each frame is sent with a direct await, never by creating a new task per message
+        (every extra task costs an additional trip through the event loop).
         """
         print(f"🔄 [PROCESSOR] Message processor started (thread: {threading.current_thread().name})")
         message_count = 0
         
         while True:
             try:
-                # Check if there are any messages in the queue
-                if not self.message_queue.empty():
-                    message = self.message_queue.get_nowait()  # Get message without waiting
-                    message_count += 1
-                    
-                    print(f"📤 [PROCESSOR] Processing message #{message_count}: {message.get('type', 'unknown')}")
-                    
-                    # Send message to frontend if WebSocket is still connected
-                    if self.websocket:
-                        await self.websocket.send_text(json.dumps(message))
-                        print(f"✅ [PROCESSOR] Message sent via WebSocket")
-                    else:
-                        print("⚠️ [PROCESSOR] No WebSocket connection available")
+                # Sleep until at least one message arrives (no polling)
+                queue = self.message_queue
+                if not queue:
+                    self.message_ready.clear()
+                    await self.message_ready.wait()
+                    continue
+                
+                # Then take everything that is waiting in the queue
+                batch = [queue.popleft() for _ in range(min(len(queue), MAX_BATCH_MESSAGES))]
                 
-                # Wait a tiny bit before checking again (prevents busy waiting)
-                await asyncio.sleep(0.01)  # 10 milliseconds
+                # 🛑 close() was called - send what came before the stop marker, then finish
+                stopping = STOP_PROCESSING in batch
+                if stopping:
+                    batch = batch[:batch.index(STOP_PROCESSING)]
+                    if not batch:
+                        break
+                
+                message_count += len(batch)
+                if __debug__ and self.log_messages:
+                    logger.debug(f"📤 [PROCESSOR] Sending {len(batch)} message(s) (total: {message_count})")
+                
+                # Send messages to frontend if WebSocket is still connected
+                if self.websocket:
+                    await self.websocket.send_bytes(encode_frame(batch, self.record_seq))
+                else:
+                    print("⚠️ [PROCESSOR] No WebSocket connection available")
+                
+                if stopping:
+                    break
                 
             except Exception as e:
                 print(f"❌ [PROCESSOR] Error processing messages: {e}")
@@ -419,18 +759,102 @@ class TranscriptionManager:
         
         print("🛑 [PROCESSOR] Message processor stopped")
     
-    def send_audio(self, audio_data: bytes):
+    async def send_audio(self, audio_data: Union[bytes, bytearray, memoryview]):
+        """
+        Queue audio data to be sent to Deepgram for transcription
+        
+        This method receives audio data from the frontend and hands it to the audio sender task.
+        Any bytes-like object works - it is queued as-is, without copying.
+        
+        It only waits when Deepgram falls behind and the queue is full. No chunk may be
+        dropped (see AUDIO_QUEUE_MAXSIZE), so we wait for room instead - meanwhile the
+        browser's audio stays in the socket buffers (backpressure).
+        """
+        # Only queue if we have a connection and it's active
+        if not (self.audio_queue and self.is_connected):  # ← SAFETY CHECK!
+            return
+        
+        await self.audio_queue.put(audio_data)
+    
+    async def _drain_audio(self):
         """
-        Send audio data to Deepgram for transcription
+        Forward queued audio chunks to Deepgram in order
+        
+        Every send() goes through the SDK, the WebSocket library, TLS and the socket, so
+        chunks that are already waiting (or arrive within AUDIO_BATCH_WINDOW) are combined
+        into a single send of up to AUDIO_BATCH_BYTES.
         
-        This method receives audio data from the frontend and forwards it to Deepgram
+        The Deepgram live client's send() is a blocking call, so it runs in a worker thread
+        to keep the event loop free for receiving more audio and sending transcripts.
         """
-        try:
-            # Only send if we have a connection and it's active
-            if self.connection and self.is_connected:  # ← SAFETY CHECK!
-                self.connection.send(audio_data)  # Send raw audio bytes to Deepgram
-        except Exception as e:
-            print(f"Error sending audio: {e}")
+        while True:
+            audio_data = await self.audio_queue.get()
+            taken = 1  # Chunks taken from the queue for this send (see finish_stream)
+            try:
+                # 📦 COALESCE SMALL CHUNKS
+                # A chunk is sent as-is unless more audio is already waiting - only then are the
+                # chunks copied together into one bytearray (sent as-is too: the WebSocket library
+                # accepts any bytes-like object). Waiting for chunks that haven't arrived yet is
+                # opt-in: it only happens when AUDIO_BATCH_WINDOW is above 0.
+                batch = None
+                size = len(audio_data)
+                deadline = self.loop.time() + AUDIO_BATCH_WINDOW if AUDIO_BATCH_WINDOW > 0 else None
+                while size < AUDIO_BATCH_BYTES:
+                    try:
+                        # Take chunks that are already waiting without any delay
+                        next_chunk = self.audio_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        if deadline is None:
+                            break
+                        remaining = deadline - self.loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            next_chunk = await asyncio.wait_for(self.audio_queue.get(), timeout=remaining)
+                        except asyncio.TimeoutError:
+                            break
+                
+                    if batch is None:
+                        batch = bytearray(audio_data)
+                    batch += next_chunk
+                    size += len(next_chunk)
+                    taken += 1
+                
+                if batch is not None:
+                    audio_data = batch
+                
+                try:
+                    if self.connection and self.is_connected:
+                        # Send raw audio bytes to Deepgram. The thread's Future is kept so close()
+                        # can let this send finish before the stream is closed
+                        self._send_future = DEEPGRAM_EXECUTOR.submit(self.connection.send, audio_data)
+                        await asyncio.wrap_future(self._send_future)
+                except Exception as e:
+                    print(f"Error sending audio: {e}")
+            finally:
+                # Mark the chunks as handled, so audio_queue.join() knows when all audio is sent
+                for _ in range(taken):
+                    self.audio_queue.task_done()
+    
+    async def finish_stream(self):
+        """
+        End the Deepgram stream gracefully, so the last words still get transcribed
+        
+        Used when the browser sends STOP_COMMAND and is still connected:
+        1. Wait until the audio sender has sent every chunk that is still queued
+        2. Close the Deepgram stream in a worker thread. finish() tells Deepgram that no more
+           audio is coming and keeps listening for half a second, so the final results for
+           the last audio still arrive (on_message() queues them as usual)
+        Afterwards close() only has to queue STOP_PROCESSING behind those results.
+        """
+        if self.audio_queue is not None:
+            await self.audio_queue.join()
+        
+        connection, self.connection = self.connection, None
+        if connection:
+            await self.loop.run_in_executor(
+                DEEPGRAM_CONNECT_EXECUTOR, self._finish_connection, connection, self._send_future
+            )
     
     def close(self):
         """
@@ -438,17 +862,56 @@ class TranscriptionManager:
         
         This method is called when we're done with transcription
         It properly closes connections and cleans up resources
+        
+        Closing the Deepgram stream (finish()) waits for Deepgram's threads and socket to shut
+        down, so it runs in a worker thread - the WebSocket handler returns right away and the
+        event loop can serve other connections meanwhile. Calling close() twice does nothing.
         """
+        if self._closed:
+            return
+        self._closed = True
+        
         try:
             self.is_connected = False
             
-            # Close Deepgram connection if it exists
+            if self.dropped_interim_count:
+                print(f"📊 [QUEUE] {self.dropped_interim_count} interim result(s) were dropped for a slow client")
+            
+            # Let process_messages() finish on its own if it is still running
+            if self.message_ready is not None:
+                self._enqueue(STOP_PROCESSING)
+            
+            # Stop the audio sender task
+            if self.audio_sender_task:
+                self.audio_sender_task.cancel()
+                self.audio_sender_task = None
+            
+            # Close Deepgram connection if it exists (in the background)
+            # Cancelling the audio task doesn't stop a send() a worker thread is already
+            # running, so _finish_connection() waits for that send before calling finish()
             if self.connection:
-                self.connection.finish()  # Properly close the connection
+                self.loop.run_in_executor(
+                    DEEPGRAM_CONNECT_EXECUTOR, self._finish_connection, self.connection, self._send_future
+                )
                 self.connection = None
                 
         except Exception as e:
             print(f"Error closing transcription manager: {e}")
+    
+    @staticmethod
+    def _finish_connection(connection, pending_send: Optional[Future] = None):
+        """
+        Properly close a Deepgram live connection (runs in a worker thread)
+        
+        pending_send is the last send() handed to DEEPGRAM_EXECUTOR - it is allowed to
+        finish first, so audio is never written to a stream that finish() is closing.
+        """
+        try:
+            if pending_send is not None:
+                wait_for_threads([pending_send])
+            connection.finish()
+        except Exception as e:
+            print(f"Error closing Deepgram connection: {e}")
 
 # 🤖 AI PROCESSOR CLASS
 # This class handles all AI-related functionality (generating summaries)
@@ -476,26 +939,186 @@ class AIProcessor:
         Returns:
             Clean JSON string ready for parsing
         """
-        # Remove leading/trailing whitespace
-        cleaned = response.strip()
-        
-        # Check if response is wrapped in markdown code blocks
-        if cleaned.startswith('```json') and cleaned.endswith('```'):
-            # Remove the ```json at the start and ``` at the end
-            cleaned = cleaned[7:-3]  # Remove first 7 chars (```json\n) and last 3 chars (\n```)
-            cleaned = cleaned.strip()  # Remove any remaining whitespace
-        elif cleaned.startswith('```') and cleaned.endswith('```'):
-            # Handle generic code blocks without 'json' specifier
-            cleaned = cleaned[3:-3]  # Remove first 3 chars (```) and last 3 chars (```)
-            cleaned = cleaned.strip()
+        # Check if response is wrapped in markdown code blocks (```json or plain ```)
+        # The pattern also ignores whitespace around the fences and the JSON
+        match = JSON_FENCE_RE.match(response)
+        # Use the text inside the fences, or the whole response if there are none
+        cleaned = match.group(1) if match else response.strip()
         
         # Log for better understanding of output
         logger.debug(f"[_clean_json_response] Raw response:\n{response}")
         logger.debug(f"[_clean_json_response] Cleaned response:\n{cleaned}")
         return cleaned
     
+    @staticmethod
+    def _summary_cache_key(text: str, summary_type: str) -> Tuple[str, bytes]:
+        """Cache key for a summary: the summary type plus a short hash of the text"""
+        return (summary_type, hashlib.blake2b(text.encode(), digest_size=16).digest())
+    
+    @staticmethod
+    def _cached_summary(cache_key: Tuple[str, bytes]):
+        """Return the stored summary for this key (or None) and mark it as recently used"""
+        cached_summary = SUMMARY_CACHE.get(cache_key)
+        if cached_summary is not None:
+            SUMMARY_CACHE.move_to_end(cache_key)  # Mark as most recently used
+            logger.info("   ⚡ Cache hit - returning stored summary without calling Gemini")
+        return cached_summary
+    
+    @staticmethod
+    def _remember_summary(cache_key: Tuple[str, bytes], summary_data: Dict[str, Any]):
+        """
+        Store a successful summary in the cache
+        
+        Only summaries that parsed correctly are stored - errors are not cached, so they can be retried.
+        """
+        SUMMARY_CACHE[cache_key] = summary_data
+        if len(SUMMARY_CACHE) > SUMMARY_CACHE_MAX_ENTRIES:
+            SUMMARY_CACHE.popitem(last=False)  # Drop the least recently used entry
+    
+    @staticmethod
+    def _short_text_summary(text: str, summary_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a minimal summary for very short texts, or None if the text needs Gemini
+        
+        The text itself becomes the summary and its only key point. Splitting stops after
+        SHORT_SUMMARY_MAX_WORDS words, so checking a long transcript stays cheap.
+        """
+        stripped = text.strip()
+        if len(stripped.split(None, SHORT_SUMMARY_MAX_WORDS)) >= SHORT_SUMMARY_MAX_WORDS:
+            return None
+        logger.info(f"✂️ [SHORT_TEXT] Fewer than {SHORT_SUMMARY_MAX_WORDS} words - skipping Gemini")
+        return {
+            "summary": stripped,
+            "key_points": [stripped] if stripped else [],
+            "action_items": [],
+            "decisions": [],
+            "next_steps": [],
+            "type": summary_type
+        }
+    
+    @staticmethod
+    def _build_prompt(text: str, summary_type: str) -> str:
+        """
+        Build the Gemini prompt for this summary type
+        
+        Unknown summary types fall back to the default meeting template.
+        """
+        logger.info("📝 [PROMPT] Creating Gemini API prompt based on summary type...")
+        logger.info(f"   🎯 Summary type received: '{summary_type}'")
+        
+        # Different prompts for different types of analysis
+        template_name = summary_type if summary_type in PROMPT_PARTS else "meeting"
+        logger.info(f"   📋 Using {template_name.upper()} prompt template")
+        prompt_prefix, prompt_suffix = PROMPT_PARTS[template_name]
+        prompt = f"{prompt_prefix}{text}{prompt_suffix}"
+        
+        # Log prompt information for debugging
+        logger.info(f"   📏 Generated prompt length: {len(prompt)} characters")
+        # Show first 200 characters of the template (without the full text to avoid spam)
+        prompt_preview = prompt_prefix[:200] + ("..." if len(prompt_prefix) > 200 else "")
+        logger.debug(f"   📖 Prompt preview (without full text): '{prompt_preview}'")
+        return prompt
+    
+    @staticmethod
+    def _parse_summary(ai_response: str, summary_type: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Turn Gemini's text reply into a summary dictionary
+        
+        Returns:
+            (summary, True) when the reply is valid JSON with the expected shape,
+            or (error response with the raw reply, False) when it isn't
+        """
+        logger.info("📨 [GEMINI_RESPONSE] Processing Gemini API response...")
+        logger.info(f"   📏 Raw response length: {len(ai_response)} characters")
+        
+        # Show first 300 characters of response for debugging
+        response_preview = ai_response[:300] + ("..." if len(ai_response) > 300 else "")
+        logger.debug(f"   📖 Raw response preview:\n'{response_preview}'")
+        
+        # 🔍 TRY TO PARSE AS JSON
+        logger.info("🔍 [JSON_PARSING] Attempting to parse response as JSON...")
+        # The AI should return JSON, but sometimes it includes extra text or markdown formatting
+        try:
+            # Clean the AI response to extract pure JSON
+            logger.debug("   🧹 Cleaning response with _clean_json_response()...")
+            cleaned_response = AIProcessor._clean_json_response(ai_response)
+            logger.debug(f"   📏 Cleaned response length: {len(cleaned_response)} characters")
+            
+            # Show preview of cleaned response
+            cleaned_preview = cleaned_response[:200] + ("..." if len(cleaned_response) > 200 else "")
+            logger.debug(f"   📖 Cleaned response preview:\n'{cleaned_preview}'")
+            
+            # Try to parse the cleaned response as JSON
+            logger.debug("   🔧 Attempting orjson.loads()...")
+            summary_data = orjson.loads(cleaned_response)
+            logger.info("   ✅ JSON parsing successful!")
+            logger.debug(f"   📊 Parsed data type: {type(summary_data)}")
+            
+            # ✅ CHECK THE SHAPE - the frontend expects an object whose list fields are lists
+            # (ValueError is also the base class of orjson.JSONDecodeError, so a wrong shape
+            # takes the same fallback path as invalid JSON below)
+            if not isinstance(summary_data, dict):
+                raise ValueError(f"expected a JSON object, got {type(summary_data).__name__}")
+            for field in SUMMARY_LIST_FIELDS:
+                if field in summary_data and not isinstance(summary_data[field], list):
+                    raise ValueError(f"'{field}' should be a list, got {type(summary_data[field]).__name__}")
+            logger.debug(f"   🔑 Dictionary keys found: {list(summary_data.keys())}")
+            
+            # Add metadata about the response
+            logger.debug("   📝 Adding metadata to response...")
+            summary_data["type"] = summary_type
+            summary_data["raw_response"] = ai_response
+            
+            logger.info("   📤 Returning processed summary data")
+            return summary_data, True
+            
+        except ValueError as json_error:
+            # If JSON parsing fails (or the JSON has the wrong shape), return the raw response
+            logger.warning(f"   ❌ JSON parsing failed: {json_error}")
+            logger.debug(f"   📄 Problematic text: '{ai_response[:100]}...'")
+            
+            error_response = {
+                "summary": "AI generated a response but it wasn't in the expected format.",
+                "raw_response": ai_response,
+                "type": summary_type,
+                "error": "Response format error - see raw_response for actual AI output",
+                "json_error": str(json_error)
+            }
+            logger.warning(f"   📤 Returning JSON error response")
+            return error_response, False
+    
     @staticmethod
     async def generate_summary(text: str, summary_type: str = "meeting") -> Dict[str, Any]:
+        """
+        Generate a summary, sharing the work between identical requests
+        
+        If the same text and summary type is already being summarized (e.g. a double click
+        on "Summarize"), we wait for that result instead of sending Gemini the same prompt twice.
+        Everything runs on the event loop thread, so checking and registering the request
+        happen without any await in between - no lock is needed.
+        
+        The Gemini call runs as its own task, not inside any one request. Every caller (the
+        first one too) waits for it through shield(), so a cancelled request - e.g. the user
+        closed the tab - only stops its own waiting; the others still get the summary.
+        """
+        # Very short texts are answered right away - no Gemini call, cache or sharing needed
+        short_summary = AIProcessor._short_text_summary(text, summary_type)
+        if short_summary is not None:
+            return short_summary
+        
+        cache_key = AIProcessor._summary_cache_key(text, summary_type)
+        task = SUMMARY_IN_FLIGHT.get(cache_key)
+        if task is not None:
+            logger.info("🤝 [GENERATE_SUMMARY] Same summary is already being generated - waiting for it")
+        else:
+            task = asyncio.create_task(AIProcessor._generate_summary(text, summary_type, cache_key))
+            SUMMARY_IN_FLIGHT[cache_key] = task
+            # Forget the task once it is done (until then this dict also keeps it referenced)
+            task.add_done_callback(lambda _: SUMMARY_IN_FLIGHT.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    @staticmethod
+    async def _generate_summary(text: str, summary_type: str, cache_key: Tuple[str, bytes]) -> Dict[str, Any]:
         """
         Generate Gemini API summary using Google Gemini
         
@@ -509,6 +1132,7 @@ class AIProcessor:
         Args:
             text: The transcribed text to summarize
             summary_type: Type of summary to generate ("meeting", "action_items", etc.)
+            cache_key: The SUMMARY_CACHE key for this text and summary type
         
         Returns:
             Dictionary containing the Gemini API-generated summary and analysis
@@ -544,76 +1168,14 @@ class AIProcessor:
                 }
                 logger.error(f"❌ [ERROR] No API key found, returning: {error_response}")
                 return error_response
+            
+            # 🗄️ CHECK THE SUMMARY CACHE
+            cached_summary = AIProcessor._cached_summary(cache_key)
+            if cached_summary is not None:
+                return cached_summary
 
             # 📝 CREATE GEMINI API PROMPT BASED ON SUMMARY TYPE
-            logger.info("📝 [PROMPT] Creating Gemini API prompt based on summary type...")
-            logger.info(f"   🎯 Summary type received: '{summary_type}'")
-            
-            # Different prompts for different types of analysis
-            if summary_type == "action_items":
-                logger.info("   📋 Using ACTION_ITEMS prompt template")
-                # Focus on tasks and to-dos
-                prompt = f"""
-                Analyze this transcription and extract action items, tasks, and to-dos:
-                
-                Text: {text}
-                
-                Please provide a JSON response with:
-                - action_items: List of specific tasks or actions mentioned
-                - Each action item should include task, responsible_party (if mentioned), and deadline (if mentioned)
-                """
-                
-            elif summary_type == "key_points":
-                logger.info("   🔑 Using KEY_POINTS prompt template")
-                # Focus on main takeaways
-                prompt = f"""
-                Analyze this transcription and extract the key points and main takeaways:
-                
-                Text: {text}
-                
-                Please provide a JSON response with:
-                - key_points: List of the most important points discussed
-                - summary: Brief overall summary
-                """
-                
-            elif summary_type == "speaker_analysis":
-                logger.info("   👥 Using SPEAKER_ANALYSIS prompt template")
-                # Focus on what each speaker contributed
-                prompt = f"""
-                Analyze this transcription and provide per-speaker analysis:
-                
-                Text: {text}
-                
-                Please provide a JSON response with:
-                - speaker_summary: List of objects with speaker_id, main_points, and action_items for each speaker
-                - summary: Overall summary of the conversation
-                """
-                
-            else:
-                logger.info("   📊 Using DEFAULT MEETING prompt template")
-                # Default comprehensive meeting summary
-                prompt = f"""
-                Analyze this meeting transcription and provide a comprehensive summary:
-                
-                Text: {text}
-                
-                Please provide a JSON response with:
-                - summary: Brief overall summary (2-3 sentences)
-                - key_points: List of main discussion points
-                - action_items: List of tasks/actions with responsible_party and deadline if mentioned
-                - decisions: List of decisions made
-                - next_steps: List of next steps or follow-ups
-                
-                Make sure the response is valid JSON format.
-                """
-            
-            # Log prompt information for debugging
-            prompt_length = len(prompt)
-            logger.info(f"   📏 Generated prompt length: {prompt_length} characters")
-            # Show first 200 characters of prompt (without the full text to avoid spam)
-            prompt_start = prompt.split("Text: {text}")[0] if "Text: {text}" in prompt else prompt[:200]
-            prompt_preview = prompt_start[:200] + ("..." if len(prompt_start) > 200 else "")
-            logger.debug(f"   📖 Prompt preview (without full text): '{prompt_preview}'")
+            prompt = AIProcessor._build_prompt(text, summary_type)
             
             # 🤖 SEND REQUEST TO GEMINI API
             logger.info("🤖 [GEMINI_REQUEST] Sending request to Gemini API...")
@@ -621,63 +1183,20 @@ class AIProcessor:
             logger.info("   📤 Sending prompt to Gemini API (this may take a few seconds)...")
             
             # Generate content using the Gemini API model
-            response = model.generate_content(prompt)
+            # Neither call blocks the event loop while waiting for Gemini,
+            # so WebSocket transcription sessions keep running during a summary request
+            if GEMINI_HAS_ASYNC:
+                response = await model.generate_content_async(prompt)
+            else:
+                # Blocking SDK call - run it in a worker thread instead of on the event loop
+                response = await asyncio.get_running_loop().run_in_executor(GEMINI_EXECUTOR, model.generate_content, prompt)
             logger.info("   ✅ Received response from Gemini API")
             
-            # Extract the text response from Gemini
-            ai_response = response.text
-            logger.info("📨 [GEMINI_RESPONSE] Processing Gemini API response...")
-            logger.info(f"   📏 Raw response length: {len(ai_response)} characters")
-            logger.debug(f"   🔤 Response type: {type(ai_response)}")
-            
-            # Show first 300 characters of response for debugging
-            response_preview = ai_response[:300] + ("..." if len(ai_response) > 300 else "")
-            logger.debug(f"   📖 Raw response preview:\n'{response_preview}'")
-            
-            # 🔍 TRY TO PARSE AS JSON
-            logger.info("🔍 [JSON_PARSING] Attempting to parse response as JSON...")
-            # The AI should return JSON, but sometimes it includes extra text or markdown formatting
-            try:
-                # Clean the AI response to extract pure JSON
-                logger.debug("   🧹 Cleaning response with _clean_json_response()...")
-                cleaned_response = AIProcessor._clean_json_response(ai_response)
-                logger.debug(f"   📏 Cleaned response length: {len(cleaned_response)} characters")
-                
-                # Show preview of cleaned response
-                cleaned_preview = cleaned_response[:200] + ("..." if len(cleaned_response) > 200 else "")
-                logger.debug(f"   📖 Cleaned response preview:\n'{cleaned_preview}'")
-                
-                # Try to parse the cleaned response as JSON
-                logger.debug("   🔧 Attempting json.loads()...")
-                summary_data = json.loads(cleaned_response)
-                logger.info("   ✅ JSON parsing successful!")
-                logger.debug(f"   📊 Parsed data type: {type(summary_data)}")
-                
-                if isinstance(summary_data, dict):
-                    logger.debug(f"   🔑 Dictionary keys found: {list(summary_data.keys())}")
-                
-                # Add metadata about the response
-                logger.debug("   📝 Adding metadata to response...")
-                summary_data["type"] = summary_type
-                summary_data["raw_response"] = ai_response
-                
-                logger.info("   📤 Returning processed summary data")
-                return summary_data
-                
-            except json.JSONDecodeError as json_error:
-                # If JSON parsing fails, return the raw response
-                logger.warning(f"   ❌ JSON parsing failed: {json_error}")
-                logger.debug(f"   📄 Problematic text: '{ai_response[:100]}...'")
-                
-                error_response = {
-                    "summary": "AI generated a response but it wasn't in the expected format.",
-                    "raw_response": ai_response,
-                    "type": summary_type,
-                    "error": "Response format error - see raw_response for actual AI output",
-                    "json_error": str(json_error)
-                }
-                logger.warning(f"   📤 Returning JSON error response")
-                return error_response
+            # 🔍 PARSE THE RESPONSE AND REMEMBER IT
+            summary_data, parsed_ok = AIProcessor._parse_summary(response.text, summary_type)
+            if parsed_ok:
+                AIProcessor._remember_summary(cache_key, summary_data)
+            return summary_data
                 
         except Exception as e:
             # Handle any errors that occur during AI processing
@@ -695,6 +1214,70 @@ class AIProcessor:
             logger.error(f"   📤 Returning error response")
             logger.info("="*50)
             return error_response
+    
+    @staticmethod
+    async def stream_summary(text: str, summary_type: str = "meeting") -> AsyncIterator[bytes]:
+        """
+        Generate a summary while streaming Gemini's reply as Server-Sent Events
+        
+        Gemini's reply is forwarded piece by piece as it is written, so the user sees
+        progress after the first tokens instead of waiting for the whole reply:
+        
+            data: {"type": "delta", "delta": "...next piece of Gemini's reply..."}
+            ...
+            data: {"type": "summary", "summary": {...same dictionary /api/summarize returns...}}
+        
+        The final "summary" event is always sent, also for errors (the summary then has an "error" key).
+        """
+        logger.info("🤖 [STREAM_SUMMARY] Starting streamed Gemini API summary generation...")
+        try:
+            # ✂️ Very short texts are answered right away, like in generate_summary()
+            short_summary = AIProcessor._short_text_summary(text, summary_type)
+            if short_summary is not None:
+                yield sse_event({"type": "summary", "summary": short_summary})
+                return
+            
+            if not GEMINI_API_KEY:
+                yield sse_event({"type": "summary", "summary": {
+                    "error": "Gemini AI not configured. Please add GEMINI_API_KEY to your environment variables."
+                }})
+                return
+            
+            # 🗄️ A cached summary is sent straight away - there is nothing to stream
+            cache_key = AIProcessor._summary_cache_key(text, summary_type)
+            cached_summary = AIProcessor._cached_summary(cache_key)
+            if cached_summary is not None:
+                yield sse_event({"type": "summary", "summary": cached_summary})
+                return
+            
+            prompt = AIProcessor._build_prompt(text, summary_type)
+            
+            # 🌊 FORWARD EACH PIECE OF THE REPLY AS SOON AS GEMINI SENDS IT
+            reply_parts: List[str] = []
+            if GEMINI_HAS_ASYNC:
+                response = await model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    reply_parts.append(chunk.text)
+                    yield sse_event({"type": "delta", "delta": chunk.text})
+            else:
+                # Older SDKs can't stream asynchronously - send the whole reply as one piece
+                response = await asyncio.get_running_loop().run_in_executor(GEMINI_EXECUTOR, model.generate_content, prompt)
+                reply_parts.append(response.text)
+                yield sse_event({"type": "delta", "delta": response.text})
+            
+            # 🔍 PARSE THE COMPLETE REPLY, exactly like generate_summary()
+            summary_data, parsed_ok = AIProcessor._parse_summary("".join(reply_parts), summary_type)
+            if parsed_ok:
+                AIProcessor._remember_summary(cache_key, summary_data)
+            yield sse_event({"type": "summary", "summary": summary_data})
+            
+        except Exception as e:
+            logger.error(f"❌ [STREAM_SUMMARY] {type(e).__name__}: {e}")
+            yield sse_event({"type": "summary", "summary": {
+                "error": f"Failed to generate summary: {str(e)}",
+                "type": summary_type,
+                "error_type": type(e).__name__
+            }})
 
 # 🌐 API ENDPOINTS
 # These are the different ways our React frontend can communicate with this backend
@@ -735,8 +1318,10 @@ async def websocket_endpoint(websocket: WebSocket):
     # Initialize variables to track our connections
     # Placeholders that will be populated once the handshake succeeds:
     #   • transcription_manager → manages the audio stream to Deepgram for THIS socket
-    #   • message_task         → background asyncio Task that forwards transcripts
+    #   • receive_task         → asyncio Task that receives audio from the browser
+    #   • message_task         → asyncio Task that forwards transcripts to the browser
     transcription_manager = None
+    receive_task = None
     message_task = None
     
     try:
@@ -759,67 +1344,106 @@ async def websocket_endpoint(websocket: WebSocket):
         # Check if Deepgram connection was successful
         if not success:
             # If connection failed, tell frontend and exit
-            await websocket.send_text(json.dumps({
-                "type": "error",
-                "message": "Failed to connect to Deepgram"
-            }))
+            await websocket.send_bytes(CONNECT_FAILED_MSG)
             return
         
         # 🎉 SEND SUCCESS MESSAGE TO FRONTEND
-        # Let the React app know we're ready to receive audio
-        await websocket.send_text(json.dumps({
-            "type": "ready",
-            "message": "Ready to receive audio"
-        }))
-        
-        # 🚀 START BACKGROUND MESSAGE PROCESSING
-        # This task runs in parallel, continuously checking for messages from Deepgram
-        # and sending them to the frontend
-        print(f"🚀 [WEBSOCKET] Starting background message processing task...")
-        message_task = asyncio.create_task(transcription_manager.process_messages())
-        print(f"✅ [WEBSOCKET] Background task created: {id(message_task)}")
+        # Let the React app know we're ready to receive audio (pre-encoded frame)
+        await websocket.send_bytes(READY_MSG)
         
-        # 🔄 MAIN LOOP - RECEIVE AUDIO DATA
+        # 🔄 RECEIVE AUDIO DATA
         # This loop runs continuously, waiting for audio data from the frontend
-        print("🔄 [WEBSOCKET] Starting main audio receive loop...")
-        audio_chunk_count = 0
+        # It runs for every audio chunk, so it must stay as light as possible:
+        # we decide once (not per chunk) whether chunk logging is wanted at all.
+        # Chunks are only counted for that debug log - running with python -O
+        # removes the counting code completely (__debug__ becomes False).
+        log_chunks = __debug__ and logger.isEnabledFor(logging.DEBUG)
+        chunk_counter = itertools.count(1)
         
-        while True:
-            try:
-                # Wait for audio data from the frontend
-                # receive_bytes() gets raw audio data (not text)
-                data = await websocket.receive_bytes()
-                audio_chunk_count += 1
-                
-                if audio_chunk_count % 50 == 0:  # Print every 50th chunk to avoid spam
-                    print(f"🎵 [WEBSOCKET] Received audio chunk #{audio_chunk_count} ({len(data)} bytes)")
-                
-                # Forward the audio data to Deepgram for transcription
-                transcription_manager.send_audio(data)
-                
-            except WebSocketDisconnect:
-                # This happens when the user closes their browser or stops recording
-                print(f"🔌 [WEBSOCKET] Client disconnected (processed {audio_chunk_count} audio chunks)")
-                break
+        async def receive_audio() -> bool:
+            """Forward browser audio until it stops - returns True if it sent STOP_COMMAND"""
+            while True:
+                try:
+                    # Wait for audio data from the frontend
+                    # Audio arrives as binary frames; the only text frame is STOP_COMMAND
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(message.get("code", 1000))
+                    data = message.get("bytes")
+                    if data is None:
+                        if message.get("text") == STOP_COMMAND:
+                            print("🏁 [WEBSOCKET] Client stopped recording - sending the last results")
+                            return True
+                        continue
+                    
+                    if __debug__ and log_chunks:
+                        # Log every 64th chunk to avoid spam (bitmask check is cheaper than %)
+                        chunk_number = next(chunk_counter)
+                        if not chunk_number & 63:
+                            logger.debug(f"🎵 [WEBSOCKET] Received audio chunk #{chunk_number} ({len(data)} bytes)")
+                    
+                    # Forward the audio data to Deepgram for transcription
+                    # (only waits if Deepgram has fallen behind, see send_audio)
+                    await transcription_manager.send_audio(data)
+                    
+                except WebSocketDisconnect:
+                    # This happens when the user closes their browser or stops recording
+                    print("🔌 [WEBSOCKET] Client disconnected")
+                    break
+                    
+                except (websockets.exceptions.ConnectionClosed, RuntimeError):
+                    # The socket is already closed - there is nobody left to send an error to
+                    print("🔌 [WEBSOCKET] Connection closed while receiving audio")
+                    break
                 
-            except Exception as e:
-                # Handle any other errors that might occur
-                print(f"Error receiving audio data: {e}")
-                await websocket.send_text(json.dumps({
-                    "type": "error",
-                    "message": f"Error processing audio: {str(e)}"
-                }))
-                break
+                # Any other error is not caught here: it ends this task and is reported
+                # once by the handler below, instead of being handled on every audio chunk
+            
+            return False
+        
+        # 🚀 RUN BOTH DIRECTIONS SIDE BY SIDE
+        # Each connection has exactly two tasks (plus the audio sender started in start_transcription):
+        #   • receive_audio()      → browser audio in, queued for the audio sender task
+        #   • process_messages()   → the ONLY place that awaits the message queue and sends transcripts
+        # Nothing creates a task per audio chunk or per transcript - Deepgram callbacks only
+        # schedule plain functions on the loop (call_soon_threadsafe), which is much cheaper.
+        # When the browser sends STOP_COMMAND it is still listening: the last audio is sent,
+        # Deepgram finishes the stream, and process_messages() sends the last results before
+        # we close the socket (each step has a time limit).
+        # When the browser is gone, sending fails, or anything else goes wrong, the other side
+        # is cancelled right away, so a connection never keeps half-running.
+        receive_task = asyncio.create_task(receive_audio())
+        message_task = asyncio.create_task(transcription_manager.process_messages())
+        done, pending = await asyncio.wait({receive_task, message_task}, return_when=asyncio.FIRST_COMPLETED)
+        client_stopped = receive_task in done and receive_task.exception() is None and receive_task.result()
+        if client_stopped and message_task in pending:
+            try:
+                await asyncio.wait_for(transcription_manager.finish_stream(), timeout=STOP_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                print("⚠️ [WEBSOCKET] Deepgram took too long to finish - closing anyway")
+            # Queues STOP_PROCESSING, so process_messages() sends what came before it and stops
+            transcription_manager.close()
+            drained, pending = await asyncio.wait(pending, timeout=MESSAGE_DRAIN_TIMEOUT)
+            done |= drained
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)  # Wait until the cancellation has finished
+        for task in done:
+            task.result()  # Re-raise an unexpected error so the handler below reports it
+        
+        if client_stopped:
+            # Everything is sent - closing the socket tells the browser the recording is done
+            await websocket.close()
     
     except Exception as e:
         # Handle any errors that occur during setup
         print(f"WebSocket error: {e}")
         try:
             # Try to send error message to frontend
-            await websocket.send_text(json.dumps({
+            await websocket.send_bytes(json_record(orjson.dumps({
                 "type": "error",
                 "message": f"WebSocket error: {str(e)}"
-            }))
+            })))
         except:
             # If we can't send the error message, just log it
             print("Could not send error message to client")
@@ -829,18 +1453,17 @@ async def websocket_endpoint(websocket: WebSocket):
         # Clean up all resources to prevent memory leaks
         print("🧹 [WEBSOCKET] Starting cleanup process...")
         
-        # Cancel the background message processing task
-        if message_task:
-            print("🛑 [WEBSOCKET] Canceling background message task...")
-            message_task.cancel()
-            try:
-                await message_task  # Wait for it to finish canceling
-                print("✅ [WEBSOCKET] Background task canceled successfully")
-            except asyncio.CancelledError:
-                print("✅ [WEBSOCKET] Background task cancellation confirmed")
-                pass  # This is expected when canceling a task
+        # Cancel the receive and send tasks if they are still running
+        # (e.g. when this handler itself was cancelled by the server shutting down)
+        running_tasks = [task for task in (receive_task, message_task) if task and not task.done()]
+        if running_tasks:
+            print("🛑 [WEBSOCKET] Canceling background tasks...")
+            for task in running_tasks:
+                task.cancel()
+            await asyncio.gather(*running_tasks, return_exceptions=True)
+            print("✅ [WEBSOCKET] Background tasks canceled")
         
-        # Close the Deepgram connection
+        # Close the Deepgram connection (does nothing if it was already closed above)
         if transcription_manager:
             print("🔌 [WEBSOCKET] Closing Deepgram connection...")
             transcription_manager.close()
@@ -849,8 +1472,40 @@ async def websocket_endpoint(websocket: WebSocket):
 
 # 📝 HTTP POST ENDPOINT FOR AI SUMMARIES
 # This endpoint receives transcribed text and returns AI-generated summaries
+async def read_summary_request(request: Request) -> Tuple[str, str]:
+    """
+    Read and check the JSON body of a summary request
+    
+    We parse the JSON ourselves with orjson instead of going through a Pydantic model.
+    Raises HTTPException (400/422) when the body is unusable.
+    
+    Returns:
+        (text, summary_type)
+    """
+    try:
+        data: SummaryRequest = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    
+    text = data.get("text", "")
+    summary_type = data.get("summary_type", "meeting")
+    
+    # 🔍 VALIDATE INPUT
+    # Both fields must be strings (this is what Pydantic used to check for us)
+    if not isinstance(text, str) or not isinstance(summary_type, str):
+        raise HTTPException(status_code=422, detail="'text' and 'summary_type' must be strings")
+    
+    # Check if we have text to summarize
+    if not text.strip():
+        # If no text provided, return error
+        raise HTTPException(status_code=400, detail="No text provided for summarization")
+    
+    return text, summary_type
+
 @app.post("/api/summarize")
-async def create_summary(request: SummaryRequest):
+async def create_summary(request: Request):
     """
     Create AI summary from transcribed text
     
@@ -873,19 +1528,16 @@ async def create_summary(request: SummaryRequest):
     }
     """
     try:
-        # 🔍 VALIDATE INPUT
-        # Check if we have text to summarize
-        if not request.text or not request.text.strip():
-            # If no text provided, return error
-            raise HTTPException(status_code=400, detail="No text provided for summarization")
+        # 📥 PARSE AND VALIDATE THE REQUEST BODY
+        text, summary_type = await read_summary_request(request)
         
         # 🤖 GENERATE AI SUMMARY
         # Call our AI processor to create the summary
-        summary = await AIProcessor.generate_summary(request.text, request.summary_type)
+        summary = await AIProcessor.generate_summary(text, summary_type)
         
         # 📤 RETURN THE SUMMARY
-        # FastAPI automatically converts our dictionary to JSON
-        return summary
+        # ORJSONResponse serializes the dictionary directly with orjson
+        return ORJSONResponse(summary)
         
     except HTTPException:
         # Re-raise HTTP exceptions (these are handled by FastAPI)
@@ -896,8 +1548,38 @@ async def create_summary(request: SummaryRequest):
         print(f"Error in summarize endpoint: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+# 🌊 STREAMING SUMMARY ENDPOINT
+# Same request as /api/summarize, but Gemini's reply is streamed back as Server-Sent Events
+# while it is being written. /api/summarize stays for clients that can't read an SSE stream.
+@app.post("/api/summarize/stream")
+async def create_summary_stream(request: Request):
+    """
+    Create AI summary and stream it as Server-Sent Events (text/event-stream)
+    
+    Request body: same as /api/summarize
+    
+    Response: a stream of "data: {...}" events
+    - {"type": "delta", "delta": "..."}      → the next piece of Gemini's reply (shows progress)
+    - {"type": "summary", "summary": {...}}  → the finished summary (same shape as /api/summarize)
+    """
+    # Bad requests are rejected with a normal HTTP error before the stream starts
+    text, summary_type = await read_summary_request(request)
+    return StreamingResponse(
+        AIProcessor.stream_summary(text, summary_type),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},  # Don't let proxies hold events back
+    )
+
 # 🏥 HEALTH CHECK ENDPOINT
 # This endpoint tells us if the server is running properly
+# API keys are read once at startup and don't change while the server runs,
+# so everything in the health response except the timestamp is serialized up front
+HEALTH_JSON_PREFIX = orjson.dumps({
+    "status": "healthy",                                  # Server is running
+    "deepgram_configured": bool(DEEPGRAM_API_KEY),        # Speech-to-text service status
+    "gemini_configured": bool(GEMINI_API_KEY),            # AI summary service status
+})[:-1] + b',"timestamp":'                                # Drop the closing } to append the timestamp
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -910,22 +1592,45 @@ async def health_check():
     {
         "status": "healthy",
         "deepgram_configured": true/false,
-        "gemini_configured": true/false
+        "gemini_configured": true/false,
+        "timestamp": server time
     }
     """
-    # Check if our AI services are properly configured
-    deepgram_configured = bool(os.getenv("DEEPGRAM_API_KEY"))  # Convert to boolean
-    gemini_configured = bool(os.getenv("GEMINI_API_KEY"))      # Convert to boolean
-    
-    return {
-        "status": "healthy",                          # Server is running
-        "deepgram_configured": deepgram_configured,   # Speech-to-text service status
-        "gemini_configured": gemini_configured,       # AI summary service status
-        "timestamp": asyncio.get_event_loop().time()  # Current server time
-    }
+    # Service configuration was checked at startup - only the timestamp is new
+    # time.monotonic() is the same kind of clock the event loop uses, read directly
+    # without looking up the event loop on every request
+    timestamp = time.monotonic()  # Current server time
+    
+    # A Python float's repr is valid JSON
+    body = HEALTH_JSON_PREFIX + repr(timestamp).encode() + b"}"
+    return Response(content=body, media_type="application/json")
 
 # 🏠 ROOT ENDPOINT
 # This is what you see when you visit http://localhost:8000 in your browser
+# The welcome message never changes, so the whole response (body and headers) is built once
+# when the server starts and the same Response object is returned for every request
+ROOT_RESPONSE = Response(media_type="application/json", content=orjson.dumps({
+    "message": "🎤 AI Note Taker API",
+    "description": "Real-time transcription with AI-powered summaries",
+    "version": "1.0.0",
+    "endpoints": {
+        "websocket": "/ws - Real-time audio transcription",
+        "summarize": "/api/summarize - Generate AI summaries",
+        "summarize_stream": "/api/summarize/stream - Generate AI summaries, streamed as Server-Sent Events",
+        "health": "/api/health - Server health check",
+        "docs": "/docs - API documentation (Swagger UI)"
+    },
+    "features": [
+        "🎤 Real-time speech-to-text with Deepgram",
+        "👥 Speaker identification (diarization)",
+        "✏️ Auto-punctuation and smart formatting",
+        "🤖 AI-powered summaries with Google Gemini",
+        "📋 Action item extraction",
+        "🔑 Key point identification",
+        "👤 Per-speaker analysis"
+    ]
+}))
+
 @app.get("/")
 async def root():
     """
@@ -934,26 +1639,7 @@ async def root():
     This endpoint provides basic information about the API.
     It's the default page users see when they visit the server URL.
     """
-    return {
-        "message": "🎤 AI Note Taker API",
-        "description": "Real-time transcription with AI-powered summaries",
-        "version": "1.0.0",
-        "endpoints": {
-            "websocket": "/ws - Real-time audio transcription",
-            "summarize": "/api/summarize - Generate AI summaries",
-            "health": "/api/health - Server health check",
-            "docs": "/docs - API documentation (Swagger UI)"
-        },
-        "features": [
-            "🎤 Real-time speech-to-text with Deepgram",
-            "👥 Speaker identification (diarization)",
-            "✏️ Auto-punctuation and smart formatting",
-            "🤖 AI-powered summaries with Google Gemini",
-            "📋 Action item extraction",
-            "🔑 Key point identification",
-            "👤 Per-speaker analysis"
-        ]
-    }
+    return ROOT_RESPONSE
 
 # 🚀 SERVER STARTUP
 # This code runs when we start the server with: python main.py
@@ -982,4 +1668,31 @@ if __name__ == "__main__":
         # The debugger will handle running the app
     else:
         # Normal mode - start the server
-        uvicorn.run(app, host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+        # DEV=1 turns on auto-reload (single process); otherwise run one worker per CPU core
+        # WEB_CONCURRENCY overrides the worker count (same variable uvicorn's CLI uses)
+        dev_mode = bool(os.getenv("DEV"))
+        workers = 1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+        print(f"⚙️ Mode: {'development (auto-reload)' if dev_mode else f'production ({workers} workers)'}")
+        
+        # loop="uvloop" uses a fast C event loop (libuv) for the WebSocket audio relay
+        # http="httptools" uses a C-based HTTP parser
+        # ws="websockets" picks the websockets library for WebSocket connections;
+        # ws_per_message_deflate=True is already uvicorn's default - it is only spelled out
+        # here to pin it. Transcriptions are binary records with no JSON keys, so compression
+        # mostly shrinks the transcript text itself (and batches of back-to-back records)
+        # access_log=False skips a log line for every request
+        # "main:app" is an import string - uvicorn needs it to start workers or reload
+        # Each worker is a separate process with its own Deepgram sessions and its own
+        # summary cache (SUMMARY_CACHE / SUMMARY_IN_FLIGHT are not shared between workers)
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            ws="websockets",
+            ws_per_message_deflate=True,
+            reload=dev_mode,
+            workers=workers,
+            access_log=False,
+        )
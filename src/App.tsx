@@ -18,6 +18,69 @@ import './App.css';
 // These interfaces define the structure of data we expect to receive/send
 import { TranscriptionMessage, AISummary, ConnectionStatus, SummaryType } from './types';
 
+// 🔤 Shared decoder for the UTF-8 text inside binary WebSocket frames
+// Created once and reused for every message instead of once per message
+const textDecoder = new TextDecoder('utf-8');
+
+// 📦 BINARY FRAME FORMAT (must match FRAME_RECORD_HEADER in backend/main.py)
+// Each WebSocket frame from the backend holds one or more records:
+//   uint8 record type | uint8 is_final | uint8 speaker | uint32 seq | uint32 length | UTF-8 text
+// Numbers are little-endian; the header is 11 bytes.
+const RECORD_HEADER_SIZE = 11;
+const RECORD_JSON = 0;           // text is a JSON message (ready, error, connection status...)
+const RECORD_TRANSCRIPTION = 1;  // text is a transcribed sentence - no JSON needed
+const NO_SPEAKER = 255;          // speaker byte value when diarization found no speaker
+
+// 🏁 ENDING A RECORDING (must match STOP_COMMAND in backend/main.py)
+// Instead of closing the WebSocket ourselves, we send this text frame and let the backend
+// close it once the transcripts of the last words have been sent.
+const STOP_COMMAND = 'stop';
+const STOP_CLOSE_TIMEOUT_MS = 10000; // close it ourselves if the backend hasn't by then
+
+/**
+ * 🧩 DECODE A BINARY FRAME
+ * 
+ * Walks the frame with a DataView and turns every record into a TranscriptionMessage,
+ * so the rest of the app handles them exactly like JSON messages.
+ * For final results this also builds the piece to append to the transcript (delta):
+ * "\n[Speaker N]: text" with a speaker, " text" without one. The backend keeps no
+ * transcript of its own, so this is the only place that format is defined.
+ */
+const decodeFrame = (buffer: ArrayBuffer): TranscriptionMessage[] => {
+  const view = new DataView(buffer);
+  const bytes = new Uint8Array(buffer);
+  const messages: TranscriptionMessage[] = [];
+  let offset = 0;
+  
+  while (offset + RECORD_HEADER_SIZE <= buffer.byteLength) {
+    const recordType = view.getUint8(offset);
+    const isFinal = view.getUint8(offset + 1) === 1;
+    const speaker = view.getUint8(offset + 2);
+    const seq = view.getUint32(offset + 3, true);     // true = little-endian
+    const length = view.getUint32(offset + 7, true);
+    const start = offset + RECORD_HEADER_SIZE;
+    const text = textDecoder.decode(bytes.subarray(start, start + length));
+    offset = start + length;
+    
+    if (recordType === RECORD_JSON) {
+      messages.push(JSON.parse(text));
+    } else if (recordType === RECORD_TRANSCRIPTION) {
+      const hasSpeaker = speaker !== NO_SPEAKER;
+      messages.push({
+        type: 'transcription',
+        text,
+        is_final: isFinal,
+        seq,
+        speaker: hasSpeaker ? speaker : undefined,
+        has_diarization: hasSpeaker,
+        delta: isFinal ? (hasSpeaker ? `\n[Speaker ${speaker}]: ${text}` : ` ${text}`) : undefined
+      });
+    }
+    // Unknown record types are skipped (newer backend, older frontend)
+  }
+  return messages;
+};
+
 /**
  * 🎤 MAIN APP COMPONENT
  * 
@@ -330,6 +393,10 @@ function App() {
           extensions: ws.extensions
         });
         
+        // The backend sends binary frames (see decodeFrame above).
+        // 'arraybuffer' lets us read them synchronously with a DataView.
+        ws.binaryType = 'arraybuffer';
+        
         websocketRef.current = ws;
         console.log('📦 WebSocket stored in ref for later use');
 
@@ -370,7 +437,7 @@ function App() {
           // event contains: data (JSON string from server), target (WebSocket), origin (server URL), timeStamp
           console.log('📊 Raw Message Details:', {
             dataType: typeof event.data,
-            dataSize: event.data.length,
+            dataSize: typeof event.data === 'string' ? event.data.length : event.data.byteLength,
             timestamp: new Date().toISOString(),
             rawData: event.data
           });
@@ -380,108 +447,123 @@ function App() {
           console.log('   • This event handler receives and processes the message');
           
           try {
-            console.log('🔄 Parsing JSON message from backend...');
-            // Parse JSON message from backend
-            const data: TranscriptionMessage = JSON.parse(event.data);
-            console.log('✅ JSON parsing successful!');
-            console.log('📊 Parsed message data:', data);
-            console.log('📊 Message Structure Analysis:', {
-              messageType: data.type,
-              hasText: !!data.text,
-              isFinal: data.is_final,
-              hasFullTranscript: !!data.full_transcript,
-              hasMessage: !!data.message
-            });
+            console.log('🔄 Decoding message from backend...');
+            // 📦 Binary frames can hold several messages (records) - see decodeFrame above.
+            // A text frame would be a single JSON message.
+            const messages: TranscriptionMessage[] = typeof event.data === 'string'
+              ? [JSON.parse(event.data)]
+              : decodeFrame(event.data);
+            console.log(`✅ Decoded ${messages.length} message(s)`);
             
-            // Handle different types of messages
-            console.log('🔄 Processing message based on type...');
-            switch (data.type) {
-              case 'transcription':
-                console.log('📝 ==================== TRANSCRIPTION MESSAGE ====================');
-                console.log('📝 Processing transcription message from Deepgram!');
-                console.log('📊 Transcription Details:', {
-                  text: data.text,
-                  is_final: data.is_final,
-                  full_transcript_length: data.full_transcript?.length || 0,
-                  textPreview: data.text ? data.text.substring(0, 50) + '...' : 'No text'
-                });
-                console.log('📊 Transcription Flow:');
-                console.log('   • Your voice → Microphone → MediaRecorder → WebSocket → Server');
-                console.log('   • Server → Deepgram AI → Transcription → WebSocket → This app');
+            for (const data of messages) {
+              console.log('📊 Parsed message data:', data);
+              console.log('📊 Message Structure Analysis:', {
+                messageType: data.type,
+                hasText: !!data.text,
+                isFinal: data.is_final,
+                hasDelta: !!data.delta,
+                hasMessage: !!data.message
+              });
+              
+              // Handle different types of messages
+              console.log('🔄 Processing message based on type...');
+              switch (data.type) {
+                case 'transcription':
+                  console.log('📝 ==================== TRANSCRIPTION MESSAGE ====================');
+                  console.log('📝 Processing transcription message from Deepgram!');
+                  console.log('📊 Transcription Details:', {
+                    text: data.text,
+                    is_final: data.is_final,
+                    delta_length: data.delta?.length || 0,
+                    textPreview: data.text ? data.text.substring(0, 50) + '...' : 'No text'
+                  });
+                  console.log('📊 Transcription Flow:');
+                  console.log('   • Your voice → Microphone → MediaRecorder → WebSocket → Server');
+                  console.log('   • Server → Deepgram AI → Transcription → WebSocket → This app');
                 
-                // This is transcribed text from Deepgram
-                if (data.text) {
-                  if (data.is_final) {
-                    // Final text - update main transcription
-                    console.log('✅ ==================== FINAL TRANSCRIPTION ====================');
-                    console.log('✅ Final transcription received - this is the confirmed text!');
-                    console.log('📊 Final Text Details:', {
-                      finalText: data.text,
-                      fullTranscriptLength: data.full_transcript?.length || 0,
-                      fullTranscriptPreview: data.full_transcript ? data.full_transcript.substring(0, 100) + '...' : 'No full transcript'
-                    });
-                    console.log('🔄 Updating main transcription state...');
-                    setTranscription(data.full_transcript || '');
-                    setInterimText(''); // Clear interim text
-                    console.log('🔄 Cleared interim text (no longer needed)');
-                    console.log('✅ UI updated with final transcription!');
+                  // This is transcribed text from Deepgram
+                  if (data.text) {
+                    if (data.is_final) {
+                      // Final text - update main transcription
+                      console.log('✅ ==================== FINAL TRANSCRIPTION ====================');
+                      console.log('✅ Final transcription received - this is the confirmed text!');
+                      console.log('📊 Final Text Details:', {
+                        finalText: data.text,
+                        delta: data.delta
+                      });
+                      console.log('🔄 Appending final text to main transcription...');
+                      // The backend sends only the new piece (with its speaker label);
+                      // we build the full transcript here instead of receiving it every time
+                      const delta = data.delta || '';
+                      setTranscription(prev => prev ? prev + delta : delta.trim());
+                      setInterimText(''); // Clear interim text
+                      console.log('🔄 Cleared interim text (no longer needed)');
+                      console.log('✅ UI updated with final transcription!');
+                    } else {
+                      // Interim text - show what's being processed
+                      console.log('⏱️ ==================== INTERIM TRANSCRIPTION ====================');
+                      console.log('⏱️ Interim transcription - live preview while speaking!');
+                      console.log('📊 Interim Details:', {
+                        interimText: data.text,
+                        textLength: data.text.length,
+                        isTemporary: true
+                      });
+                      console.log('📊 Interim vs Final:');
+                      console.log('   • Interim = Live preview (may change as you continue speaking)');
+                      console.log('   • Final = Confirmed text (won\'t change anymore)');
+                      console.log('🔄 Updating interim text state...');
+                      setInterimText(data.text);
+                      console.log('✅ UI updated with interim transcription!');
+                    }
                   } else {
-                    // Interim text - show what's being processed
-                    console.log('⏱️ ==================== INTERIM TRANSCRIPTION ====================');
-                    console.log('⏱️ Interim transcription - live preview while speaking!');
-                    console.log('📊 Interim Details:', {
-                      interimText: data.text,
-                      textLength: data.text.length,
-                      isTemporary: true
-                    });
-                    console.log('📊 Interim vs Final:');
-                    console.log('   • Interim = Live preview (may change as you continue speaking)');
-                    console.log('   • Final = Confirmed text (won\'t change anymore)');
-                    console.log('🔄 Updating interim text state...');
-                    setInterimText(data.text);
-                    console.log('✅ UI updated with interim transcription!');
+                    console.log('⚠️ Transcription message received but no text content');
                   }
-                } else {
-                  console.log('⚠️ Transcription message received but no text content');
-                }
-                break;
+                  break;
               
-              case 'connection_status':
-                console.log('🔗 ==================== CONNECTION STATUS MESSAGE ====================');
-                console.log('🔗 Connection status update from server:', data.message);
-                console.log('📊 Status Details:', {
-                  newStatus: data.message,
-                  timestamp: new Date().toISOString()
-                });
-                console.log('📊 Status Flow: Server monitoring → Status change → WebSocket → UI update');
-                // Backend is telling us about connection status
-                if (data.message) {
-                  console.log('🔄 Updating connection status in UI...');
-                  setConnectionStatus(data.message as ConnectionStatus);
-                  console.log('✅ Connection status updated!');
-                }
-                break;
+                case 'ready':
+                  // A new transcription session started on the backend - start a fresh transcript
+                  console.log('🎙️ Backend ready to receive audio:', data.message);
+                  setTranscription('');
+                  setInterimText('');
+                  break;
+                
+                case 'connection_status':
+                  console.log('🔗 ==================== CONNECTION STATUS MESSAGE ====================');
+                  console.log('🔗 Connection status update from server:', data.message);
+                  console.log('📊 Status Details:', {
+                    newStatus: data.message,
+                    timestamp: new Date().toISOString()
+                  });
+                  console.log('📊 Status Flow: Server monitoring → Status change → WebSocket → UI update');
+                  // Backend is telling us about connection status
+                  if (data.message) {
+                    console.log('🔄 Updating connection status in UI...');
+                    setConnectionStatus(data.message as ConnectionStatus);
+                    console.log('✅ Connection status updated!');
+                  }
+                  break;
               
-              case 'error':
-                console.log('❌ ==================== ERROR MESSAGE ====================');
-                console.log('❌ Error message received from backend:', data.message);
-                console.log('📊 Error Details:', {
-                  errorMessage: data.message,
-                  timestamp: new Date().toISOString(),
-                  source: 'WebSocket Server'
-                });
-                console.log('📊 Error Flow: Server error → WebSocket → Client error handling → UI error display');
-                // Something went wrong on the backend
-                console.log('🔄 Setting error state for UI display...');
-                setError(data.message || 'Unknown error occurred');
-                console.log('✅ Error state updated - user will see error message');
-                break;
+                case 'error':
+                  console.log('❌ ==================== ERROR MESSAGE ====================');
+                  console.log('❌ Error message received from backend:', data.message);
+                  console.log('📊 Error Details:', {
+                    errorMessage: data.message,
+                    timestamp: new Date().toISOString(),
+                    source: 'WebSocket Server'
+                  });
+                  console.log('📊 Error Flow: Server error → WebSocket → Client error handling → UI error display');
+                  // Something went wrong on the backend
+                  console.log('🔄 Setting error state for UI display...');
+                  setError(data.message || 'Unknown error occurred');
+                  console.log('✅ Error state updated - user will see error message');
+                  break;
                 
-              default:
-                console.log('⚠️ ==================== UNKNOWN MESSAGE TYPE ====================');
-                console.log('⚠️ Received message with unknown type:', data.type);
-                console.log('📊 Unknown Message Details:', data);
-                break;
+                default:
+                  console.log('⚠️ ==================== UNKNOWN MESSAGE TYPE ====================');
+                  console.log('⚠️ Received message with unknown type:', data.type);
+                  console.log('📊 Unknown Message Details:', data);
+                  break;
+              }
             }
             console.log('✅ Message processing complete!');
           } catch (error) {
@@ -492,7 +574,7 @@ function App() {
               errorMessage: error instanceof Error ? error.message : String(error),
               rawMessageData: event.data,
               dataType: typeof event.data,
-              dataLength: event.data.length
+              dataLength: typeof event.data === 'string' ? event.data.length : event.data.byteLength
             });
             console.log('📄 Raw message data that failed to parse:', event.data);
             console.log('💡 Possible causes:');
@@ -811,6 +893,8 @@ function App() {
       });
       
       // STEP 1: Stop the MediaRecorder if it's active
+      const recorder = mediaRecorderRef.current;
+      const recorderWasActive = !!recorder && recorder.state !== 'inactive';
       if (mediaRecorderRef.current && mediaRecorderRef.current.state !== 'inactive') {
         console.log('🎬 Stopping MediaRecorder (current state:', mediaRecorderRef.current.state + ')');
         mediaRecorderRef.current.stop();
@@ -854,28 +938,42 @@ function App() {
         console.log('⚠️ No audio stream to stop');
       }
       
-      // STEP 3: Close WebSocket connection
+      // STEP 3: Ask the backend to finish, then let it close the WebSocket
       if (websocketRef.current) {
-        console.log('🔌 ==================== CLOSING WEBSOCKET ====================');
-        console.log('🔌 Closing WebSocket connection...');
-        console.log('📊 WebSocket State Before Closing:', {
-          readyState: websocketRef.current.readyState,          // Numeric readyState (0-3) indicating connection status
-          readyStateText: ['CONNECTING', 'OPEN', 'CLOSING', 'CLOSED'][websocketRef.current.readyState],
-          url: websocketRef.current.url,
-          bufferedAmount: websocketRef.current.bufferedAmount
+        const ws = websocketRef.current;
+        console.log('🏁 ==================== FINISHING WEBSOCKET ====================');
+        console.log('📊 WebSocket State Before Finishing:', {
+          readyState: ws.readyState,          // Numeric readyState (0-3) indicating connection status
+          readyStateText: ['CONNECTING', 'OPEN', 'CLOSING', 'CLOSED'][ws.readyState],
+          url: ws.url,
+          bufferedAmount: ws.bufferedAmount
         });
-        console.log('📊 Why Close WebSocket?');
-        console.log('   • Recording stopped - no more audio to send');
-        console.log('   • Prevents unnecessary network connection');
-        console.log('   • Cleans up resources properly');
-        console.log('   • Server can free up connection slot');
+        console.log('📊 Why not just close it?');
+        console.log('   • Deepgram is still transcribing the last words we sent');
+        console.log('   • The stop command lets the backend send those results first');
+        console.log('   • The backend then closes the connection (onclose runs as usual)');
         
-        console.log('🔄 Calling websocket.close()...');
-        websocketRef.current.close();
-        console.log('🔄 Clearing WebSocket reference...');
-        websocketRef.current = null;
-        console.log('✅ WebSocket closed and reference cleared');
-        console.log('📊 Connection Lifecycle Complete: CONNECTING → OPEN → CLOSING → CLOSED ✅');
+        const sendStop = () => {
+          if (ws.readyState === WebSocket.OPEN) {
+            console.log('🏁 Sending stop command to backend...');
+            ws.send(STOP_COMMAND);
+            // Safety net: close the connection ourselves if the backend doesn't
+            setTimeout(() => ws.close(), STOP_CLOSE_TIMEOUT_MS);
+          }
+          // A new recording may already have its own WebSocket - only clear our own
+          if (websocketRef.current === ws) {
+            websocketRef.current = null;
+          }
+          console.log('✅ Stop command sent and reference cleared');
+        };
+        
+        if (recorder && recorderWasActive) {
+          // The recorder hands over its last audio chunk just before its 'stop' event,
+          // so waiting for that event makes sure the last chunk is sent before the command
+          recorder.addEventListener('stop', sendStop, { once: true });
+        } else {
+          sendStop();
+        }
       } else {
         console.log('⚠️ ==================== NO WEBSOCKET TO CLOSE ====================');
         console.log('⚠️ No WebSocket connection to close');
@@ -21,17 +21,16 @@
  * When Deepgram processes audio, it sends us messages with this structure.
  * 
  * ENHANCED FEATURES:
- * Now includes speaker identification, feature status, and enhanced formatting
+ * Now includes speaker identification and enhanced formatting
  * 
- * EXAMPLE MESSAGE:
+ * EXAMPLE MESSAGE (as built by decodeFrame in App.tsx):
  * {
  *   type: "transcription",
  *   text: "Hello world",
  *   is_final: true,
+ *   seq: 0,
  *   speaker: 0,
- *   has_diarization: true,
- *   word_count: 2,
- *   features_used: { diarization: true, punctuation: true, ... }
+ *   has_diarization: true
  * }
  */
 export interface TranscriptionMessage {
@@ -39,13 +38,15 @@ export interface TranscriptionMessage {
   text?: string;                   // The transcribed text (with smart formatting!) - optional with ?
   is_final?: boolean;              // Whether this is final result or still being processed - optional
   message?: string;                // Status or error messages from backend - optional
-  full_transcript?: string;        // Complete transcript accumulated so far - optional
+  delta?: string;                  // Final results only: text to append to the transcript (with speaker label)
   
   // 🆕 NEW ENHANCED FEATURES FROM DEEPGRAM
   speaker?: number;                // Speaker ID from diarization (e.g., 0, 1, 2) - which person is speaking
   has_diarization?: boolean;       // Whether speaker detection is working properly
-  word_count?: number;             // Number of words in this transcription segment
-  features_used?: DeepgramFeatures; // Which Deepgram AI features are currently active
+  
+  // 📦 BINARY FRAMES
+  // Transcriptions arrive as binary records (see decodeFrame in App.tsx), numbered per connection
+  seq?: number;                    // Record number, counting up per connection (0, 1, 2, ...)
 }
 
 /**
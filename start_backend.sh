@@ -53,12 +53,21 @@ echo ""
 # - main:app = run the 'app' object from main.py file
 # - --host 0.0.0.0 = accept connections from any IP address (not just localhost)
 # - --port 8000 = run on port 8000
+# - --workers N = run N server processes (one per CPU core) so requests use every core
+# - --loop uvloop = use the fast libuv-based event loop
+# - --http httptools = use the C-based HTTP parser
+# - --ws websockets --ws-per-message-deflate true = compress WebSocket messages (uvicorn's default, pinned here)
+# - --no-access-log = don't print a log line for every request
 # - No --reload flag = don't restart automatically on code changes (more stable)
 #
 # WHY NO --RELOAD:
 # The --reload flag can sometimes cause issues with WebSocket connections
-# For development, you can manually restart the server when you make changes
-uvicorn main:app --host 0.0.0.0 --port 8000
+# and only runs a single process. For development, use: DEV=1 python main.py
+#
+# WORKER COUNT:
+# Defaults to the number of CPU cores; set WEB_CONCURRENCY to override it
+WORKERS=${WEB_CONCURRENCY:-$(getconf _NPROCESSORS_ONLN)}
+uvicorn main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS" --loop uvloop --http httptools --ws websockets --ws-per-message-deflate true --no-access-log
 
 # 💡 TROUBLESHOOTING TIPS:
 #